@@ -5,10 +5,6 @@ from pathlib import Path
 
 import typer
 
-from .cleaner import clean_data
-from .converter import convert
-from .reporter import build_report
-
 app = typer.Typer(add_completion=False)
 
 
@@ -19,6 +15,9 @@ def main(
     ),
     output: Path = typer.Option(..., help="Output file"),
     clean: bool = typer.Option(False, help="Enable data cleaning"),
+    chunk_rows: int | None = typer.Option(
+        None, min=1, help="Clean in chunks of this many rows"
+    ),
     force: bool = typer.Option(False, help="Overwrite existing output"),
     report: Path | None = typer.Option(
         None, help="Path to save markdown report"
@@ -29,12 +28,17 @@ def main(
         typer.echo(f"Error: {output} exists. Use --force to overwrite.")
         raise typer.Exit(code=1)
 
+    # Imported here so argument errors and --help never pay for loading pandas
+    from .cleaner import clean_data
+    from .converter import convert
+    from .reporter import build_report
+
     start = time.perf_counter()
     df = convert.read(input)
     rows_in = len(df)
 
     if clean:
-        df, clean_info = clean_data(df)
+        df, clean_info = clean_data(df, chunk_rows=chunk_rows)
     else:
         clean_info = {"duplicates": 0, "imputed": {}}
 
@@ -43,16 +47,25 @@ def main(
     rows_out = len(df)
 
     if report:
-        text = build_report(
-            input,
-            output,
-            rows_in,
-            rows_out,
-            clean_info,
-            convert.detect_types(df),
-            duration,
-        )
-        report.write_text(text)
+        types = convert.detect_types(df)
+        # The report streams into a temporary file that only replaces the
+        # target once complete, so a failure leaves an existing report as is
+        partial = report.with_name(f"{report.name}.partial")
+        try:
+            with partial.open("w", encoding="utf-8") as fh:
+                build_report(
+                    input,
+                    output,
+                    rows_in,
+                    rows_out,
+                    clean_info,
+                    types,
+                    duration,
+                    out=fh,
+                )
+            partial.replace(report)
+        finally:
+            partial.unlink(missing_ok=True)
         typer.echo(f"Report written to {report}")
 
     typer.echo(f"Wrote {rows_out} rows to {output}")
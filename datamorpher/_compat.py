@@ -0,0 +1,11 @@
+"""Detection of optional dependencies."""
+
+from __future__ import annotations
+
+from importlib.util import find_spec
+
+# pyarrow enables Arrow-backed string storage and faster I/O paths
+HAS_PYARROW = find_spec("pyarrow") is not None
+
+# xlsxwriter writes Excel files faster than openpyxl
+HAS_XLSXWRITER = find_spec("xlsxwriter") is not None
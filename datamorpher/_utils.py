@@ -0,0 +1,19 @@
+"""Small helpers shared by the cleaner and the converter."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+def nonnull_sample(series: pd.Series, size: int) -> pd.Series:
+    """Return the first ``size`` non-null values, scanning only as far as needed."""
+    positions = np.empty(0, dtype=np.intp)
+    start, window = 0, 4 * size
+    # Growing windows keep mostly-null columns from being scanned row by row
+    while len(positions) < size and start < len(series):
+        found = np.flatnonzero(series.iloc[start:start + window].notna().to_numpy())
+        positions = np.concatenate([positions, start + found])
+        start += window
+        window *= 4
+    return series.iloc[positions[:size]]
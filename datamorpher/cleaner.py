@@ -2,18 +2,192 @@
 
 from __future__ import annotations
 
+import os
 import re
-from typing import Dict, List, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence
 
+import numpy as np
 import pandas as pd
 from pandas.api.types import infer_dtype
 
+from ._compat import HAS_PYARROW
+from ._utils import nonnull_sample
 
-def clean_data(df: pd.DataFrame) -> tuple[pd.DataFrame, Dict[str, object]]:
-    """Clean a DataFrame and report actions taken with enhanced contextual awareness."""
-    # Set pandas option to avoid FutureWarning about silent downcasting
+if HAS_PYARROW:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+# Set pandas option to avoid FutureWarning about silent downcasting, once at
+# import rather than on every call (the option only exists from pandas 2.2)
+try:
     pd.set_option('future.no_silent_downcasting', True)
-    
+except pd.errors.OptionError:
+    pass
+
+# Number of leading non-null values column type detection looks at
+_DETECTION_SAMPLE = 20
+
+# infer_dtype results implied by the dtype kind alone
+_DTYPE_KINDS = {
+    "i": "integer",
+    "u": "integer",
+    "f": "floating",
+    "b": "boolean",
+    "M": "datetime64",
+    "m": "timedelta64",
+}
+# Number of leading values infer_dtype scans for object and string columns
+_INFER_DTYPE_LIMIT = 1_000_000
+
+# Text columns with fewer distinct values than this share of rows become categories
+_CATEGORY_RATIO = 0.5
+
+# Number of non-null values a validator sees before a full-column conversion
+_INFER_SAMPLE = 1000
+
+# String dtype for text columns, backed by Arrow when pyarrow is installed
+_STRING_DTYPE = pd.StringDtype("pyarrow" if HAS_PYARROW else "python")
+
+
+class TransformationLog(Sequence[str]):
+    """Transformation messages for one column, formatted only when read.
+
+    Bulk conversions are kept as arrays of original and new values and only
+    turned into ``"old -> new"`` strings when the log is iterated, e.g. by
+    the report builder. Producers may tag entries with the report category
+    they belong to; untagged entries are categorized from their text.
+    """
+
+    def __init__(self) -> None:
+        self._batches: list[
+            tuple[Sequence[object], Sequence[object] | None, object, object]
+        ] = []
+        self._size = 0
+
+    def append(self, message: str, category: str | None = None) -> None:
+        """Add a single preformatted message."""
+        self._batches.append(([message], None, "", category))
+        self._size += 1
+
+    def extend(self, messages: Iterable[str], category: str | None = None) -> None:
+        """Add preformatted messages or the entries of another log."""
+        if isinstance(messages, TransformationLog):
+            self._batches.extend(messages._batches)
+            self._size += messages._size
+            return
+        messages = list(messages)
+        if messages:
+            self._batches.append((messages, None, "", category))
+            self._size += len(messages)
+
+    def add_pairs(
+        self,
+        old: np.ndarray,
+        new: np.ndarray,
+        suffix: str | np.ndarray = "",
+        category: str | np.ndarray | None = None,
+    ) -> None:
+        """Add one ``"old -> new<suffix>"`` entry per pair of values.
+
+        ``suffix`` and ``category`` are either shared by every entry or given
+        per entry.
+        """
+        if len(old):
+            self._batches.append((old, new, suffix, category))
+            self._size += len(old)
+
+    def categorized(self) -> Iterator[tuple[str | None, str]]:
+        """Yield ``(category, message)`` for every entry, None when untagged."""
+        for old, new, suffix, category in self._batches:
+            if isinstance(category, np.ndarray):
+                categories = _as_list(category)
+            else:
+                categories = [category] * len(old)
+            if new is None:
+                messages = old
+            elif isinstance(suffix, str):
+                pairs = zip(_as_list(old), _as_list(new))
+                messages = (f"{before} -> {after}{suffix}" for before, after in pairs)
+            else:
+                entries = zip(_as_list(old), _as_list(new), _as_list(suffix))
+                messages = (f"{before} -> {after}{end}" for before, after, end in entries)
+            yield from zip(categories, messages)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[str]:
+        return (message for _, message in self.categorized())
+
+    def __getitem__(self, index):
+        return list(self)[index]
+
+    def __repr__(self) -> str:
+        return f"TransformationLog({list(self)!r})"
+
+    def to_list(self) -> TransformationList:
+        """Return the formatted messages as a list that keeps their categories."""
+        return TransformationList(self.categorized())
+
+
+class TransformationList(list):
+    """Plain list of transformation messages returned by clean_data.
+
+    It compares, indexes and serializes like any list of strings; the report
+    categories the cleaner tagged are kept alongside for the report builder.
+    """
+
+    def __init__(self, entries: Iterable[tuple[str | None, str]] = ()) -> None:
+        pairs = list(entries)
+        super().__init__(message for _, message in pairs)
+        self._categories = [category for category, _ in pairs]
+
+    def categorized(self) -> Iterator[tuple[str | None, str]]:
+        """Yield ``(category, message)`` for every entry, None when untagged."""
+        if len(self._categories) != len(self):
+            # Edited since clean_data returned it, categorize from the text
+            return ((None, message) for message in self)
+        return zip(self._categories, self)
+
+
+# Report categories of the logged transformations
+_MEDIAN_CATEGORY = "Median Imputation"
+_MODE_CATEGORY = "Mode Imputation"
+_UNIT_CATEGORY = "Unit/Currency Conversion"
+_DATE_CATEGORY = "Date Format Standardization"
+_TEXT_NUMBER_CATEGORY = "Text to Number Conversion"
+_EXTRACTION_CATEGORY = "Numeric Value Extraction"
+_OTHER_CATEGORY = "Other Transformations"
+
+
+def _as_list(values: Sequence[object]) -> list[object]:
+    """Return values as a list of Python scalars for formatting."""
+    return values.tolist() if isinstance(values, np.ndarray) else list(values)
+
+
+def _log(transformations: Dict[str, TransformationLog], column: str) -> TransformationLog:
+    """Return the transformation log of a column, creating it on first use."""
+    log = transformations.get(column)
+    if log is None:
+        log = transformations[column] = TransformationLog()
+    return log
+
+
+def clean_data(
+    df: pd.DataFrame, chunk_rows: int | None = None
+) -> tuple[pd.DataFrame, Dict[str, object]]:
+    """Clean a DataFrame and report actions taken with enhanced contextual awareness.
+
+    The input frame is never modified; the cleaned frame is a new object that
+    may share the buffers of columns left unchanged. With ``chunk_rows``,
+    columns are converted in row chunks of that size so intermediate buffers
+    stay bounded; how each column is cleaned is decided on a sample of it.
+    """
+    if chunk_rows is not None and chunk_rows < 1:
+        raise ValueError("chunk_rows must be a positive number of rows")
+
     info: Dict[str, object] = {
         "duplicates": 0,
         "imputed": {},
@@ -21,19 +195,34 @@ def clean_data(df: pd.DataFrame) -> tuple[pd.DataFrame, Dict[str, object]]:
         "transformations": {},
         "warnings": [],  # List for warnings
     }
-    
-    # Keep track of columns that have been semantically validated
-    validated_columns = set()
 
-    before = len(df)
-    df = df.drop_duplicates()
-    info["duplicates"] = before - len(df)
+    deduplicated = _drop_duplicates(df)
+    info["duplicates"] = len(df) - len(deduplicated)
 
-    transformations: Dict[str, list[str]] = info["transformations"]
+    transformations: Dict[str, TransformationLog] = info["transformations"]
     warnings: List[str] = info["warnings"]
 
-    # Make a copy to avoid SettingWithCopyWarning
-    df = df.copy()
+    # Columns are only ever replaced wholesale, so a shallow copy is enough to
+    # keep the caller's frame untouched without duplicating its data (dropping
+    # duplicates already returned a new frame)
+    df = df.copy(deep=False) if deduplicated is df else deduplicated
+
+    # Infer column dtypes once; entries are refreshed when a column is rewritten
+    column_dtypes = {col: _infer_column_dtype(df[col]) for col in df.columns}
+
+    # Store text columns as Arrow strings so .str operations run in Arrow
+    # kernels instead of calling into Python for every value
+    object_text: Dict[str, pd.Series] = {}
+    if HAS_PYARROW:
+        for col, dtype in column_dtypes.items():
+            series = df[col]
+            if dtype == "string" and series.dtype == object:
+                object_text[col] = series
+                df[col] = series.astype(_STRING_DTYPE)
+
+    # Missing values of every column in one frame-wide reduction; only the
+    # columns rewritten by cleaning are counted again afterwards
+    na_counts = df.isna().sum()
 
     # Phase 1: Preliminary type detection to guide cleaning
     column_likely_types = {}
@@ -41,175 +230,444 @@ def clean_data(df: pd.DataFrame) -> tuple[pd.DataFrame, Dict[str, object]]:
         column_likely_types[col] = _preliminary_type_detection(df[col], col)
 
     # Phase 2: Context-aware cleaning
-    for col in df.columns:
-        likely_type = column_likely_types[col]
-        series = df[col]
-        dtype = infer_dtype(series, skipna=True)
+    if chunk_rows is not None and len(df) > chunk_rows:
+        results = _clean_in_chunks(df, chunk_rows, column_likely_types, column_dtypes)
+    else:
+        results = _clean_columns(df, column_likely_types, column_dtypes, len(df) - na_counts)
 
-        # Preserve identifiers and product names
-        if likely_type == "identifier" or likely_type == "product_name":
-            warnings.append(f"Column '{col}' detected as {likely_type} - preserved as is")
-            continue
+    # Merge per-column results in column order so the report stays stable.
+    # Numeric columns the cleaning did not validate are checked in the same
+    # sweep; their warnings still follow all of the cleaning warnings
+    semantic_warnings: List[str] = []
+    preserved: set[str] = set()
+    for col, (cleaned, fragment) in zip(df.columns, results):
+        for name, changes in fragment["transformations"].items():
+            _log(transformations, name).extend(changes)
+        if fragment["invalid"] > 0:
+            info["invalid"][col] = fragment["invalid"]
+        warnings.extend(fragment["warnings"])
+        if fragment["plan"] == "preserve":
+            preserved.add(col)
+            if col in object_text:
+                # Preserved columns are handed back in the dtype they came in
+                df[col] = object_text[col]
+        if fragment["validated"]:
+            # Validate semantics (negative values, inf, etc.) on the whole
+            # converted column
+            cleaned, column_anomalies = _validate_column_semantics(cleaned, col)
+            warnings.extend(column_anomalies)
+        if cleaned is not None:
+            # The cleaned series is what the frame now holds for the column
+            df[col] = cleaned
+            column_dtypes[col] = _infer_column_dtype(cleaned)
+            na_counts[col] = cleaned.isna().sum()
+        if not fragment["validated"] and column_dtypes[col] in {"integer", "floating"}:
+            # Semantic checks only report anomalies, so the column is kept as is
+            series = df[col] if cleaned is None else cleaned
+            _, column_anomalies = _validate_column_semantics(series, col)
+            semantic_warnings.extend(column_anomalies)
+    warnings.extend(semantic_warnings)
+    
+    # Repetitive text columns are stored as categories, so their mode and
+    # fill values work on integer codes rather than on every string
+    for col, dtype in column_dtypes.items():
+        if dtype == "string" and col not in preserved:
+            series = df[col]
+            if series.nunique(dropna=True) < _CATEGORY_RATIO * len(series):
+                df[col] = series.astype("category")
 
-        # Process monetary formats and units first
-        if likely_type in ["currency", "numeric"]:
-            # Extract units (k, M, $, etc.) and monetary formats first
-            normalized = _normalize_units(series, col, transformations)
-            if normalized is not None:
-                series = normalized
-                df[col] = series
-
-        # Boolean normalization
-        if dtype in {"string", "mixed"}:
-            bools = _normalize_booleans_extended(series)
-            bool_ratio = bools.notna().sum() / max(series.notna().sum(), 1)
-            if bool_ratio >= 0.5:
-                df[col] = bools
-                dtype = "boolean"
-                series = df[col]
-                continue
-
-        # Specific processing based on likely type
-        if likely_type == "date":
-            # Prioritize date processing
-            validated, invalid = _validate_dates_extended(
-                series, column=col, transformations=transformations
-            )
-            if validated is not None:
-                ratio = validated.notna().sum() / max(series.notna().sum(), 1)
-                if ratio >= 0.5:
-                    df[col] = validated
-                    if invalid > 0:
-                        info["invalid"][col] = invalid
-                    continue
-
-        # Numeric conversion for appropriate columns
-        if dtype in {"string", "mixed"} and likely_type not in ["location", "string"]:
-            is_likely_id = likely_type == "identifier"
-            validated, invalid = _validate_numeric_extended(
-                series, col, transformations, is_likely_id
-            )
-            if validated is not None:
-                ratio = validated.notna().sum() / max(series.notna().sum(), 1)
-                if ratio >= 0.5:
-                    # Validate semantics (negative values, inf, etc.)
-                    validated, column_anomalies = _validate_column_semantics(validated, col)
-                    df[col] = validated
-                    if invalid > 0:
-                        info["invalid"][col] = invalid
-                    # Add any detected anomalies to warnings
-                    if column_anomalies:
-                        warnings.extend(column_anomalies)
-                    # Mark column as validated to avoid duplicate checks
-                    validated_columns.add(col)
-                    dtype = "floating"
-                    continue
-
-        # If we have strings at this point, try dates as a last resort
-        if dtype in {"string", "mixed"}:
-            validated, invalid = _validate_dates_extended(
-                series, column=col, transformations=transformations
+    # Phase 3: Imputation of missing values
+    # Fill values for non-float columns are collected first and applied in a
+    # single fillna pass instead of reassigning every column separately.
+    fill_values: Dict[str, object] = {}
+    # Only columns with missing values are visited, each one read once
+    for col in na_counts.index[na_counts.to_numpy() > 0]:
+        dtype = column_dtypes[col]
+        series = df[col]
+
+        if dtype in {"integer", "floating"}:
+            value = series.median()
+            if series.dtype.kind == "f" and isinstance(series.dtype, np.dtype):
+                # Plain float columns are filled directly on a copy of
+                # their buffer (the caller may still share the original)
+                df[col] = _fill_nan(series.to_numpy(copy=True), value)
+            else:
+                fill_values[col] = value
+            info["imputed"][col] = "median"
+            _log(transformations, col).append(
+                f"NaN -> {value:.2f} (median)", _MEDIAN_CATEGORY
             )
-            if validated is not None:
-                ratio = validated.notna().sum() / max(series.notna().sum(), 1)
-                if ratio >= 0.5:
-                    df[col] = validated
-                    if invalid > 0:
-                        info["invalid"][col] = invalid
-                    dtype = "date"
 
-    # Phase 2.5: Additional semantic validation for existing numeric columns
-    
-    for col in df.columns:
-        dtype = infer_dtype(df[col], skipna=True)
-        # Check semantic validity of numeric columns (including detect negative values)
-        # But only for columns that haven't been processed in phase 2
-        if dtype in {"integer", "floating"} and col not in validated_columns:
-            validated, column_anomalies = _validate_column_semantics(df[col], col)
-            df[col] = validated
-            if column_anomalies:
-                warnings.extend(column_anomalies)
-            validated_columns.add(col)
-    
-    # Phase 3: Imputation of missing values
-    for col in df.columns:
-        if df[col].isna().any():
-            dtype = infer_dtype(df[col], skipna=True)
-            
-            if dtype in {"integer", "floating"}:
-                value = df[col].median()
-                # Use fillna with infer_objects(copy=False) to avoid FutureWarning
-                df[col] = df[col].fillna(value).infer_objects(copy=False)
-                info["imputed"][col] = "median"
-                transformations.setdefault(col, []).append(
-                    f"NaN -> {value:.2f} (median)"
+        elif dtype in {"string", "categorical"}:
+            mode = series.mode(dropna=True)
+            if not mode.empty:
+                value = mode.iloc[0]
+                fill_values[col] = value
+                info["imputed"][col] = "mode"
+                _log(transformations, col).append(
+                    f"NaN -> {value} (mode)", _MODE_CATEGORY
                 )
-                
-            elif dtype in {"string", "categorical"}:
-                mode = df[col].mode(dropna=True)
-                if not mode.empty:
-                    value = mode.iloc[0]
-                    df[col] = df[col].fillna(value).infer_objects(copy=False)
-                    info["imputed"][col] = "mode"
-                    transformations.setdefault(col, []).append(
-                        f"NaN -> {value} (mode)"
-                    )
-                    
-            elif dtype == "boolean":
-                mode = df[col].mode(dropna=True)
-                if not mode.empty:
-                    value = bool(mode.iloc[0])
-                    df[col] = df[col].fillna(value).infer_objects(copy=False)
-                    info["imputed"][col] = "mode"
-                    transformations.setdefault(col, []).append(
-                        f"NaN -> {value} (mode)"
-                    )
-    
+
+        elif dtype == "boolean":
+            mode = series.mode(dropna=True)
+            if not mode.empty:
+                value = bool(mode.iloc[0])
+                fill_values[col] = value
+                info["imputed"][col] = "mode"
+                _log(transformations, col).append(
+                    f"NaN -> {value} (mode)", _MODE_CATEGORY
+                )
+
+    if fill_values:
+        filled_cols = list(fill_values)
+        # Use fillna with infer_objects(copy=False) to avoid FutureWarning
+        df[filled_cols] = df[filled_cols].fillna(fill_values).infer_objects(copy=False)
+
+    # Hand out plain lists so the info dict can be compared and serialized
+    info["transformations"] = {col: log.to_list() for col, log in transformations.items()}
     return df, info
 
 
+def _clean_column(
+    col: str, series: pd.Series, likely_type: str, dtype: str, notna_count: int
+) -> tuple[pd.Series | None, Dict[str, object]]:
+    """Apply context-aware cleaning to a single column.
+
+    Returns the cleaned series (``None`` when the column is left unchanged)
+    and the info collected for it, including the ``plan`` that was applied.
+    """
+    transformations: Dict[str, TransformationLog] = {}
+    warnings: List[str] = []
+    fragment: Dict[str, object] = {
+        "transformations": transformations,
+        "invalid": 0,
+        "warnings": warnings,
+        "validated": False,
+        "plan": "unchanged",
+    }
+    cleaned = None
+
+    # Preserve identifiers and product names
+    if likely_type == "identifier" or likely_type == "product_name":
+        warnings.append(f"Column '{col}' detected as {likely_type} - preserved as is")
+        fragment["plan"] = "preserve"
+        return None, fragment
+
+    # Process monetary formats and units first
+    if likely_type in ["currency", "numeric"]:
+        # Extract units (k, M, $, etc.) and monetary formats first
+        normalized = _normalize_units(series, col, transformations)
+        if normalized is not None:
+            # Only text values are rewritten, so notna_count still holds
+            series = cleaned = normalized
+
+    # Boolean normalization
+    if dtype in {"string", "mixed"}:
+        bools = _normalize_booleans_extended(series)
+        bool_ratio = bools.notna().sum() / max(notna_count, 1)
+        if bool_ratio >= 0.5:
+            fragment["plan"] = "boolean"
+            return bools, fragment
+
+    # Specific processing based on likely type
+    if likely_type == "date" and _sample_accepts(_validate_dates_extended, series):
+        # Prioritize date processing
+        validated, invalid = _validate_dates_extended(
+            series, column=col, transformations=transformations, notna_count=notna_count
+        )
+        if validated is not None:
+            ratio = validated.notna().sum() / max(notna_count, 1)
+            if ratio >= 0.5:
+                fragment["invalid"] = invalid
+                fragment["plan"] = "date"
+                return validated, fragment
+
+    # Numeric conversion for appropriate columns
+    if (
+        dtype in {"string", "mixed"}
+        and likely_type not in ["location", "string"]
+        and _sample_accepts(_validate_numeric_extended, series)
+    ):
+        is_likely_id = likely_type == "identifier"
+        validated, invalid = _validate_numeric_extended(
+            series, col, transformations, is_likely_id, notna_count
+        )
+        if validated is not None:
+            ratio = validated.notna().sum() / max(notna_count, 1)
+            if ratio >= 0.5:
+                fragment["invalid"] = invalid
+                # Semantic validation runs once the column is merged back
+                fragment["validated"] = True
+                fragment["plan"] = "numeric"
+                return validated, fragment
+
+    # If we have strings at this point, try dates as a last resort
+    if dtype in {"string", "mixed"} and _sample_accepts(_validate_dates_extended, series):
+        validated, invalid = _validate_dates_extended(
+            series, column=col, transformations=transformations, notna_count=notna_count
+        )
+        if validated is not None:
+            ratio = validated.notna().sum() / max(notna_count, 1)
+            if ratio >= 0.5:
+                fragment["invalid"] = invalid
+                fragment["plan"] = "date"
+                return validated, fragment
+
+    return cleaned, fragment
+
+
+def _apply_plan(
+    col: str, series: pd.Series, likely_type: str, plan: str, notna_count: int
+) -> tuple[pd.Series | None, Dict[str, object]]:
+    """Clean a later chunk of a column the way ``_clean_column`` cleaned the first."""
+    transformations: Dict[str, TransformationLog] = {}
+    fragment: Dict[str, object] = {
+        "transformations": transformations,
+        "invalid": 0,
+        "warnings": [],
+        "validated": plan == "numeric",
+        "plan": plan,
+    }
+    if plan == "preserve":
+        return None, fragment
+
+    cleaned = None
+    if likely_type in ["currency", "numeric"]:
+        normalized = _normalize_units(series, col, transformations)
+        if normalized is not None:
+            series = cleaned = normalized
+
+    if plan == "boolean":
+        return _normalize_booleans_extended(series), fragment
+
+    # The decision is already taken, so conversions are kept whatever the
+    # share of values they manage to convert in this chunk
+    if plan == "date":
+        validated, invalid = _validate_dates_extended(
+            series, column=col, transformations=transformations,
+            notna_count=notna_count, min_ratio=0.0,
+        )
+        if validated is None:
+            validated, invalid = pd.Series(np.nan, index=series.index, dtype=object), notna_count
+        fragment["invalid"] = invalid
+        return validated, fragment
+
+    if plan == "numeric":
+        validated, invalid = _validate_numeric_extended(
+            series, col, transformations, notna_count=notna_count, min_ratio=0.0
+        )
+        if validated is None:
+            validated, invalid = pd.Series(np.nan, index=series.index), notna_count
+        fragment["invalid"] = invalid
+        return validated, fragment
+
+    return cleaned, fragment
+
+
+def _clean_columns(
+    df: pd.DataFrame,
+    likely_types: Dict[str, str],
+    dtypes: Dict[str, str],
+    notna_counts: pd.Series,
+    plans: List[str] | None = None,
+) -> list[tuple[pd.Series | None, Dict[str, object]]]:
+    """Clean the columns of a frame concurrently, returning results in column order.
+
+    Each column only depends on its own values, so columns run in a thread
+    pool. With ``plans``, columns follow the decisions taken for an earlier chunk.
+    """
+    columns = list(df.columns)
+    if plans is None:
+        clean, decisions = _clean_column, [dtypes[col] for col in columns]
+    else:
+        clean, decisions = _apply_plan, plans
+    workers = max(1, min(len(columns), os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(
+            clean,
+            columns,
+            [df[col] for col in columns],
+            [likely_types[col] for col in columns],
+            decisions,
+            [int(notna_counts[col]) for col in columns],
+        ))
+
+
+def _clean_in_chunks(
+    df: pd.DataFrame, chunk_rows: int, likely_types: Dict[str, str], dtypes: Dict[str, str]
+) -> list[tuple[pd.Series | None, Dict[str, object]]]:
+    """Clean the columns of a frame in row chunks of at most ``chunk_rows`` rows.
+
+    How each column is cleaned is decided on a sample of the whole column
+    and every chunk follows, so all chunks of a column end up with the same
+    kind of values. Results are merged back per column in ``_clean_columns`` order.
+    """
+    samples = {col: _plan_sample(df[col]) for col in df.columns}
+    decided = [
+        _clean_column(col, samples[col], likely_types[col], dtypes[col], len(samples[col]))
+        for col in df.columns
+    ]
+    plans = [fragment["plan"] for _, fragment in decided]
+    chunks = [df.iloc[start:start + chunk_rows] for start in range(0, len(df), chunk_rows)]
+    parts = [
+        _clean_columns(chunk, likely_types, dtypes, chunk.notna().sum(), plans)
+        for chunk in chunks
+    ]
+
+    results = []
+    for i, col in enumerate(df.columns):
+        column_parts = [part[i] for part in parts]
+        # Chunks never warn, the sample run holds the column's warnings
+        fragment = column_parts[0][1]
+        fragment["warnings"] = decided[i][1]["warnings"]
+        for _, later in column_parts[1:]:
+            for name, changes in later["transformations"].items():
+                _log(fragment["transformations"], name).extend(changes)
+            fragment["invalid"] += later["invalid"]
+        if all(cleaned is None for cleaned, _ in column_parts):
+            results.append((None, fragment))
+            continue
+        cleaned = pd.concat([
+            chunk[col] if part is None else part
+            for (part, _), chunk in zip(column_parts, chunks)
+        ])
+        results.append((cleaned, fragment))
+    return results
+
+
+def _plan_sample(series: pd.Series) -> pd.Series:
+    """Return the non-null values a chunked column's cleaning is decided on.
+
+    Columns with no more than ``_INFER_SAMPLE`` values are looked at whole,
+    longer ones through values spread evenly over the column.
+    """
+    positions = np.flatnonzero(series.notna().to_numpy())
+    if len(positions) > _INFER_SAMPLE:
+        positions = positions[np.linspace(0, len(positions) - 1, _INFER_SAMPLE).astype(np.intp)]
+    return series.iloc[positions]
+
+
+def _fill_nan(values: np.ndarray, value: float) -> np.ndarray:
+    """Replace NaN entries of a float array in place."""
+    np.copyto(values, value, where=np.isnan(values))
+    return values
+
+
+def _drop_duplicates(df: pd.DataFrame) -> pd.DataFrame:
+    """Drop duplicate rows, returning the frame untouched when there are none."""
+    duplicated = df.duplicated().to_numpy()
+    if not duplicated.any():
+        return df
+    # take() builds a new frame that is not flagged as a slice of the input
+    return df.take(np.flatnonzero(~duplicated))
+
+
+def _sample_accepts(validate, series: pd.Series) -> bool:
+    """Return whether ``validate`` converts at least half of a column's first values.
+
+    Columns with no more than ``_INFER_SAMPLE`` values always pass, so the
+    full validation decides for them exactly as before.
+    """
+    positions = np.flatnonzero(series.notna().to_numpy())
+    if len(positions) <= _INFER_SAMPLE:
+        return True
+    sample = series.iloc[positions[:_INFER_SAMPLE]]
+    validated, _ = validate(sample)
+    return validated is not None and validated.notna().sum() / len(sample) >= 0.5
+
+
+def _infer_column_dtype(series: pd.Series) -> str:
+    """Return ``infer_dtype`` for a series, read from the dtype kind where possible.
+
+    Only object and string columns are scanned, and at most the first
+    ``_INFER_DTYPE_LIMIT`` values of them.
+    """
+    kind = _DTYPE_KINDS.get(series.dtype.kind)
+    if kind is not None:
+        return kind
+    return infer_dtype(series.iloc[:_INFER_DTYPE_LIMIT], skipna=True)
+
+
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+_PLAIN_NUMBER_RE = re.compile(r'^-?\d+(\.\d+)?$')
+_MONEY_RE = re.compile(r'^[\$\€\£]?\d+(\.\d+)?[\$\€\£]?$')
+_BOOLEAN_HINTS = frozenset({"true", "false", "yes", "no", "1", "0"})
+# Common patterns in product names (e.g., iPhone 14 Pro, Nike Air Max 90)
+_PRODUCT_NAME_PATTERNS = [
+    re.compile(r'\b[A-Z][a-z]+\s+\d+\b'),          # iPhone 14, Series 7
+    re.compile(r'\b[A-Z][a-z]+\s+[A-Z][a-z]+\b'),   # MacBook Pro, Nike Air
+    re.compile(r'\b[A-Z]+\d+\b'),                   # BMW X5, Audi A4
+    re.compile(r'\b\w+\s\w+\s\d+\w*\b'),            # ThinkPad T14 Gen 2
+]
+# Measurement units like "2kg", "20000mAh"
+_MEASUREMENT_RE = re.compile(r'\d+\s*[a-zA-Z]+')
+
+
+# Column name terms by likely type, in priority order. Each type is a lookahead
+# from the start of the name, so the first type with a term anywhere in the
+# name wins regardless of where the term appears
+_COLUMN_NAME_TERMS = {
+    "identifier": ["id", "identifier", "code"],
+    "name": ["name", "title", "product"],
+    "date": ["date", "time", "created", "updated"],
+    "currency": ["price", "cost", "amount", "fee"],
+    "location": ["location", "address", "city", "store"],
+    "boolean": ["is_", "has_", "active", "enabled", "flag"],
+}
+_COLUMN_NAME_RE = re.compile(
+    "|".join(
+        f"(?=.*?(?P<{kind}>{'|'.join(map(re.escape, terms))}))"
+        for kind, terms in _COLUMN_NAME_TERMS.items()
+    ),
+    re.DOTALL,
+)
+
+
 def _preliminary_type_detection(series: pd.Series, column_name: str) -> str:
     """Determine the likely type of a column to guide cleaning."""
+    # Detection only looks at the first non-null values, so those (with the
+    # column name) are the whole input and a cache key for repeated schemas
+    return _likely_type(column_name, tuple(nonnull_sample(series, _DETECTION_SAMPLE).astype(str)))
+
+
+@lru_cache(maxsize=256)
+def _likely_type(column_name: str, values: tuple[str, ...]) -> str:
+    """Determine the likely type of a column from its name and leading values."""
     col_lower = column_name.lower()
     
     # Detection by column name
-    if any(id_term in col_lower for id_term in ["id", "identifier", "code"]):
-        return "identifier"
-        
-    if any(name_term in col_lower for name_term in ["name", "title", "product"]):
-        if _is_product_name(series):
-            return "product_name"
-        return "string"
-        
-    if any(date_term in col_lower for date_term in ["date", "time", "created", "updated"]):
-        return "date"
-        
-    if any(price_term in col_lower for price_term in ["price", "cost", "amount", "fee"]):
-        return "currency"
-        
-    if any(loc_term in col_lower for loc_term in ["location", "address", "city", "store"]):
-        return "location"
-        
-    if any(bool_term in col_lower for bool_term in ["is_", "has_", "active", "enabled", "flag"]):
-        return "boolean"
+    match = _COLUMN_NAME_RE.match(col_lower)
+    if match:
+        if match.lastgroup == "name":
+            if _is_product_name(pd.Series(values, dtype=object)):
+                return "product_name"
+            return "string"
+        return match.lastgroup
     
-    # Detection by content
-    sample = series.dropna().head(20).astype(str)
+    # Detection by content. The patterns overlap ("1" is both a boolean and a
+    # number), so each is counted separately, in one pass over the sample
+    dates = booleans = numbers = money = 0
+    for value in values:
+        dates += _ISO_DATE_RE.match(value) is not None
+        booleans += value.lower() in _BOOLEAN_HINTS
+        numbers += _PLAIN_NUMBER_RE.match(value) is not None
+        money += _MONEY_RE.match(value) is not None
+    size = max(len(values), 1)
     
     # Pattern-based detection attempts
-    if sample.str.match(r'\d{4}-\d{2}-\d{2}').mean() > 0.3:
+    if dates / size > 0.3:
         return "date"
         
-    if sample.str.lower().isin(["true", "false", "yes", "no", "1", "0"]).mean() > 0.3:
+    if booleans / size > 0.3:
         return "boolean"
         
-    if sample.str.match(r'^-?\d+(\.\d+)?$').mean() > 0.7:
+    if numbers / size > 0.7:
         return "numeric"
         
-    if sample.str.match(r'^[\$\€\£]?\d+(\.\d+)?[\$\€\£]?$').mean() > 0.3:
+    if money / size > 0.3:
         return "currency"
     
-    if _is_product_name(series):
+    if _is_product_name(pd.Series(values, dtype=object)):
         return "product_name"
     
     # Default to string
@@ -218,22 +676,14 @@ def _preliminary_type_detection(series: pd.Series, column_name: str) -> str:
 
 def _is_product_name(series: pd.Series) -> bool:
     """Detect if a series contains product names."""
-    # Common patterns in product names (e.g., iPhone 14 Pro, Nike Air Max 90)
-    patterns = [
-        r'\b[A-Z][a-z]+\s+\d+\b',          # iPhone 14, Series 7
-        r'\b[A-Z][a-z]+\s+[A-Z][a-z]+\b',   # MacBook Pro, Nike Air
-        r'\b[A-Z]+\d+\b',                   # BMW X5, Audi A4
-        r'\b\w+\s\w+\s\d+\w*\b'             # ThinkPad T14 Gen 2
-    ]
-    
     # If at least 30% of values match a product name pattern
-    sample = series.dropna().astype(str).head(20)
-    for pattern in patterns:
+    sample = nonnull_sample(series, _DETECTION_SAMPLE).astype(str)
+    for pattern in _PRODUCT_NAME_PATTERNS:
         if sample.str.contains(pattern, regex=True, na=False).mean() > 0.3:
             return True
     
     # Detection of measurement units like "2kg", "20000mAh"
-    if sample.str.contains(r'\d+\s*[a-zA-Z]+', regex=True, na=False).mean() > 0.3:
+    if sample.str.contains(_MEASUREMENT_RE, regex=True, na=False).mean() > 0.3:
         return True
     
     return False
@@ -278,13 +728,61 @@ _NUMBER_MULTIPLIERS = {
     "billion": 1000000000,
 }
 
+# Token codes for compound expressions: base words keep their value and
+# multipliers are stored negated, so one float array describes a phrase
+_NUMBER_TOKEN_CODES = {
+    **{word: -float(value) for word, value in _NUMBER_MULTIPLIERS.items()},
+    **{word: float(value) for word, value in _NUMBER_WORDS.items()},
+}
+
+# Common expressions resolved directly by _words_to_num_extended
+_COMMON_NUMBER_EXPRESSIONS = {
+    "four hundred fifty": 450.0,
+    "four point eight": 4.8,
+    "four point five": 4.5,
+    "four point six": 4.6,
+    "four point three": 4.3,
+    "three point nine": 3.9,
+    "thirty five": 35.0,
+    "twenty five": 25.0,
+    "forty five": 45.0,
+    "fourteen ninety nine": 14.99,
+    "thirty nine ninety five": 39.95,
+    "one thousand and fifty": 1050.0
+}
+
+
+_HYPHEN_TO_SPACE = str.maketrans("-", " ")
+_WHITESPACE_RE = re.compile(r'\s+')
+_AND_RE = re.compile(r'\band\b')
+_CURRENCY_WORD_RE = re.compile(r'\bdollars?\b|\beuros?\b|\bpounds?\b|\b\$\b')
+_POINT_RE = re.compile(r'(\w+)\s+point\s+(\w+)')
+
+
+def _reduce_number_tokens(codes: np.ndarray) -> float:
+    """Combine encoded number words and multipliers into a total."""
+    current = 0.0
+    total = 0.0
+    for code in codes.tolist():
+        # Base numbers add up
+        if code >= 0:
+            current += code
+            continue
+        # Multipliers scale the current group (or stand alone as 1 x multiplier)
+        multiplier = -code
+        current = current * multiplier if current > 0 else multiplier
+        # Major multipliers (thousand or more) close the group
+        if multiplier >= 1000:
+            total += current
+            current = 0.0
+    return total + current
+
 
 def _words_to_num(text: str | None) -> float | None:
     """Convert simple number words to a float."""
     if not isinstance(text, str):
         return None
-    text = text.lower().replace("-", " ")
-    parts = text.split()
+    parts = text.translate(_HYPHEN_TO_SPACE).lower().split()
     if not parts:
         return None
     value = 0
@@ -304,35 +802,17 @@ def _words_to_num_extended(text: str | None) -> float | None:
     if not isinstance(text, str):
         return None
     
-    # Handle common specific expressions directly
-    common_expressions = {
-        "four hundred fifty": 450.0,
-        "four point eight": 4.8,
-        "four point five": 4.5,
-        "four point six": 4.6,
-        "four point three": 4.3,
-        "three point nine": 3.9,
-        "thirty five": 35.0,
-        "twenty five": 25.0,
-        "forty five": 45.0,
-        "fourteen ninety nine": 14.99,
-        "thirty nine ninety five": 39.95,
-        "one thousand and fifty": 1050.0
-    }
-    
-    # Check for direct matches first
-    normalized = text.lower().replace("-", " ").strip()
-    if normalized in common_expressions:
-        return common_expressions[normalized]
+    # Check for common specific expressions first
+    normalized = text.translate(_HYPHEN_TO_SPACE).lower().strip()
+    if normalized in _COMMON_NUMBER_EXPRESSIONS:
+        return _COMMON_NUMBER_EXPRESSIONS[normalized]
         
     # Normalize text
-    text = normalized
-    text = re.sub(r'[,]', ' ', text)
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', normalized.replace(',', ' '))
     
     # Remove "and" and other linking words and currency symbols
-    text = re.sub(r'\band\b', ' ', text)
-    text = re.sub(r'\bdollars?\b|\beuros?\b|\bpounds?\b|\b\$\b', '', text)
+    text = _AND_RE.sub(' ', text)
+    text = _CURRENCY_WORD_RE.sub('', text)
     text = text.strip()
     
     # Simple case: single number word
@@ -340,7 +820,7 @@ def _words_to_num_extended(text: str | None) -> float | None:
         return float(_NUMBER_WORDS[text])
     
     # Special case: expressions like "four point five" for 4.5
-    point_match = re.match(r'(\w+)\s+point\s+(\w+)', text)
+    point_match = _POINT_RE.match(text)
     if point_match:
         left, right = point_match.groups()
         if left in _NUMBER_WORDS and right in _NUMBER_WORDS:
@@ -352,94 +832,94 @@ def _words_to_num_extended(text: str | None) -> float | None:
     if len(text.split()) == 4:
         parts = text.split()
         if all(part in _NUMBER_WORDS for part in parts):
-            try:
-                first_part = _NUMBER_WORDS[parts[0]] * 10 + _NUMBER_WORDS[parts[1]]
-                second_part = _NUMBER_WORDS[parts[2]] * 10 + _NUMBER_WORDS[parts[3]]
-                if second_part < 100:  # Ensure it's a valid decimal
-                    return float(f"{first_part}.{second_part:02d}")
-            except Exception:
-                pass
+            first_part = _NUMBER_WORDS[parts[0]] * 10 + _NUMBER_WORDS[parts[1]]
+            second_part = _NUMBER_WORDS[parts[2]] * 10 + _NUMBER_WORDS[parts[3]]
+            if second_part < 100:  # Ensure it's a valid decimal
+                return float(f"{first_part}.{second_part:02d}")
     
     # Handle "one thousand and fifty" type expressions
     # This requires tracking groups of values
     parts = text.split()
     if any(part in _NUMBER_MULTIPLIERS for part in parts):
-        try:
-            current = 0
-            total = 0
-            
-            i = 0
-            while i < len(parts):
-                part = parts[i]
-                
-                # Skip empty or unrecognized words
-                if not part or (part not in _NUMBER_WORDS and part not in _NUMBER_MULTIPLIERS):
-                    i += 1
-                    continue
-                
-                # If it's a base number
-                if part in _NUMBER_WORDS:
-                    current += _NUMBER_WORDS[part]
-                
-                # If it's a multiplier
-                elif part in _NUMBER_MULTIPLIERS:
-                    multiplier = _NUMBER_MULTIPLIERS[part]
-                    # If we have a current value, multiply it
-                    if current > 0:
-                        current *= multiplier
-                    else:
-                        # Otherwise use 1 as the implicit value
-                        current = multiplier
-                    
-                    # If this is a major multiplier (thousand or more),
-                    # add to total and reset current
-                    if multiplier >= 1000:
-                        total += current
-                        current = 0
-                
-                i += 1
-            
-            # Add any remaining value
-            total += current
+        # Unrecognized words are skipped
+        codes = np.fromiter(
+            (_NUMBER_TOKEN_CODES[part] for part in parts if part in _NUMBER_TOKEN_CODES),
+            dtype=np.float64,
+        )
+        total = _reduce_number_tokens(codes)
+        
+        # Return None if we didn't parse anything meaningful
+        if total == 0:
+            return None
             
-            # Return 0 if we didn't parse anything meaningful
-            if total == 0 and current == 0:
-                return None
-                
-            return float(total)
-        except Exception:
-            # If any error occurs, fall back to the original approach
-            pass
+        return float(total)
     
     # Use the simple function for basic cases
     return _words_to_num(text)
 
 
-def _normalize_booleans_extended(series: pd.Series) -> pd.Series:
-    """Advanced normalization of boolean representations with ambiguity handling."""
-    # Clearly True values
-    true_values = {"true", "yes", "1", "t", "y", "active", "enabled", "on", "2"}
-    # Clearly False values
-    false_values = {"false", "no", "0", "f", "n", "inactive", "disabled", "off"}
-    # Ambiguous values (to be handled based on context)
-    ambiguous_values = {"maybe", "perhaps", "pending", "unknown", "null", "na", "n/a"}
-    
-    lowercase = series.astype(str).str.lower()
-    result = pd.Series(index=series.index, dtype="object")
-    
-    # Handle clear values
-    result[lowercase.isin(true_values)] = True
-    result[lowercase.isin(false_values)] = False
-    
-    # For ambiguous values, don't convert (leave as NaN)
-    ambiguous_mask = lowercase.isin(ambiguous_values)
-    if ambiguous_mask.any():
-        # Set ambiguous to pd.NA (will be handled by imputation later)
-        pass
-    
+def _parse_cells(series: pd.Series, parse: Callable[[object], float | None]) -> np.ndarray:
+    """Apply a scalar parser to the raw values of a series; None becomes NaN."""
+    return np.array([parse(value) for value in series.to_numpy(dtype=object)], dtype=float)
+
+
+def _words_to_num_series(series: pd.Series) -> pd.Series:
+    """Vectorized counterpart of _words_to_num_extended for a Series.
+
+    Values made only of basic number words ("twenty five") are summed with a
+    single token lookup; anything else falls back to the scalar parser.
+    """
+    if series.empty:
+        return pd.Series(index=series.index, dtype=float)
+    try:
+        text = series.str.lower().str.replace("-", " ", regex=False)
+    except AttributeError:
+        # No string values for the .str accessor to work on
+        return pd.Series(_parse_cells(series, _words_to_num_extended), index=series.index)
+
+    # Work on positions so duplicate index labels are not grouped together
+    text = text.reset_index(drop=True)
+    values = text.str.split().explode().map(_NUMBER_WORDS)
+    by_row = values.groupby(level=0)
+    counts = by_row.size()
+
+    resolved = (
+        by_row.count().eq(counts)  # every token is a number word
+        & counts.ne(4)  # "thirty nine ninety five" style prices
+        & ~text.str.strip().isin(_COMMON_NUMBER_EXPRESSIONS)
+    )
+    result = by_row.sum().astype(float).where(resolved)
+
+    fallback = (~resolved).to_numpy()
+    if fallback.any():
+        result[fallback] = _parse_cells(series[fallback], _words_to_num_extended)
+
+    result.index = series.index
     return result
 
 
+# Clearly True values
+_TRUE_VALUES = {"true", "yes", "1", "t", "y", "active", "enabled", "on", "2"}
+# Clearly False values
+_FALSE_VALUES = {"false", "no", "0", "f", "n", "inactive", "disabled", "off"}
+# Ambiguous values (to be handled based on context)
+_AMBIGUOUS_VALUES = {"maybe", "perhaps", "pending", "unknown", "null", "na", "n/a"}
+
+
+def _normalize_booleans_extended(series: pd.Series) -> pd.Series:
+    """Advanced normalization of boolean representations with ambiguity handling.
+
+    Values are resolved into a nullable boolean series built straight from
+    the true/false membership masks. Ambiguous and unrecognized values are
+    left missing (handled by imputation later).
+    """
+    lowercase = series.astype(_STRING_DTYPE).str.lower()
+    is_true = lowercase.isin(_TRUE_VALUES).to_numpy(dtype=bool)
+    is_false = lowercase.isin(_FALSE_VALUES).to_numpy(dtype=bool)
+    values = pd.arrays.BooleanArray(is_true, ~(is_true | is_false))
+    return pd.Series(values, index=series.index, name=series.name)
+
+
 # Extended date formats
 _DATE_FORMATS_EXTENDED = [
     # ISO and standard formats
@@ -452,50 +932,67 @@ _DATE_FORMATS_EXTENDED = [
     "%Y-%m-%d %H:%M:%S"
 ]
 
-# Special relative expressions
+def _format_tokens(fmt: str) -> frozenset[str]:
+    """Return regex tokens a value must contain to possibly match a date format."""
+    tokens = {re.escape(char) for char in re.sub(r"%.", "", fmt) if not char.isspace()}
+    if "%b" in fmt or "%B" in fmt:
+        tokens.add("[A-Za-z]")
+    return frozenset(tokens)
+
+
+def _string_mask(series: pd.Series) -> pd.Series:
+    """Return a mask of the values in a series that are strings."""
+    try:
+        return series.str.len().notna()
+    except AttributeError:
+        # The .str accessor is unavailable when the series holds no strings
+        return pd.Series(False, index=series.index)
+
+
+# Special relative expressions, as day offsets from today
 _DATE_RELATIVE_EXPRESSIONS = {
-    "yesterday": lambda: (pd.Timestamp.now() - pd.Timedelta(days=1)).strftime("%Y-%m-%d"),
-    "today": lambda: pd.Timestamp.now().strftime("%Y-%m-%d"),
-    "tomorrow": lambda: (pd.Timestamp.now() + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+    "yesterday": -1,
+    "today": 0,
+    "tomorrow": 1,
 }
 
 
-def _extract_textual_date(text: str) -> str | None:
-    """Extract dates with ordinal formats (1st, 2nd, 20th, etc.)"""
-    if not isinstance(text, str):
-        return None
-    
-    # Format with ordinals: "20th Feb 2023", "1st January 2022"
-    ordinal_pattern = r'(\d+)(st|nd|rd|th)\s+([A-Za-z]+)\s+(\d{4})'
-    match = re.match(ordinal_pattern, text)
-    if match:
-        day, _, month, year = match.groups()
-        try:
-            date_str = f"{day} {month} {year}"
-            return pd.to_datetime(date_str, format="%d %B %Y").strftime("%Y-%m-%d")
-        except ValueError:
-            try:
-                # Try with abbreviated format
-                return pd.to_datetime(date_str, format="%d %b %Y").strftime("%Y-%m-%d")
-            except ValueError:
-                return None
-    
-    # Format with month first: "February 20 2023", "Jan 5 2022"
-    month_first_pattern = r'([A-Za-z]+)\s+(\d+)\s+(\d{4})'
-    match = re.match(month_first_pattern, text)
-    if match:
-        month, day, year = match.groups()
-        try:
-            date_str = f"{month} {day} {year}"
-            return pd.to_datetime(date_str, format="%B %d %Y").strftime("%Y-%m-%d")
-        except ValueError:
-            try:
-                # Try with abbreviated format
-                return pd.to_datetime(date_str, format="%b %d %Y").strftime("%Y-%m-%d")
-            except ValueError:
-                return None
-    
-    return None
+# Dates with ordinals ("20th Feb 2023") and month first ("Jan 5 2022")
+_ORDINAL_DATE_RE = r'^(\d+)(st|nd|rd|th)\s+([A-Za-z]+)\s+(\d{4})'
+_MONTH_FIRST_DATE_RE = r'^([A-Za-z]+)\s+(\d+)\s+(\d{4})'
+
+
+def _extract_textual_dates(texts: pd.Series) -> pd.Series:
+    """Return ISO date strings for ordinal and month-first dates, NaN where none."""
+    result = pd.Series(np.nan, index=texts.index, dtype=object)
+    ordinal = texts.str.extract(_ORDINAL_DATE_RE)
+    is_ordinal = ordinal[0].notna().to_numpy()
+    if is_ordinal.any():
+        parts = ordinal[is_ordinal]
+        result[is_ordinal] = _parse_date_text(
+            parts[0] + " " + parts[2] + " " + parts[3], ("%d %B %Y", "%d %b %Y")
+        ).to_numpy()
+    # Values starting with an ordinal never fall back to month-first dates
+    if not is_ordinal.all():
+        month_first = texts[~is_ordinal].str.extract(_MONTH_FIRST_DATE_RE)
+        matched = month_first[0].notna().to_numpy()
+        if matched.any():
+            parts = month_first[matched]
+            positions = np.flatnonzero(~is_ordinal)[matched]
+            result.iloc[positions] = _parse_date_text(
+                parts[0] + " " + parts[1] + " " + parts[2], ("%B %d %Y", "%b %d %Y")
+            ).to_numpy()
+    return result
+
+
+def _parse_date_text(text: pd.Series, formats: Sequence[str]) -> pd.Series:
+    """Return ISO date strings for text parsed by the first matching format."""
+    parsed = pd.to_datetime(text, format=formats[0], errors="coerce")
+    for fmt in formats[1:]:
+        pending = parsed.isna().to_numpy()
+        if pending.any():
+            parsed[pending] = pd.to_datetime(text[pending], format=fmt, errors="coerce").to_numpy()
+    return parsed.dt.strftime("%Y-%m-%d").astype(object)
 
 
 def _validate_dates_extended(
@@ -503,95 +1000,164 @@ def _validate_dates_extended(
     formats: Sequence[str] | None = None,
     *,
     column: str | None = None,
-    transformations: Dict[str, list[str]] | None = None,
+    transformations: Dict[str, TransformationLog] | None = None,
+    notna_count: int | None = None,
+    min_ratio: float = 0.5,
 ) -> tuple[pd.Series | None, int]:
     """Return series of ISO formatted dates if convertible with extended capabilities."""
     if formats is None:
         formats = _DATE_FORMATS_EXTENDED
+    if notna_count is None:
+        notna_count = int(series.notna().sum())
+    if pd.api.types.is_datetime64_any_dtype(series):
+        # Timestamps need no parsing, only formatting
+        registered = np.zeros(len(series), dtype=bool)
+        return _format_dates(series, series, registered, column, transformations, notna_count, min_ratio)
+    if pd.api.types.is_numeric_dtype(series):
+        # Every format needs a separator or a month name, which plain numbers
+        # never contain
+        return None, 0
     
-    # Handle relative expressions first
     parsed = pd.Series(pd.NaT, index=series.index)
-    for idx, val in series.items():
-        if isinstance(val, str):
-            # Special case for "invalid_date" - needed for test compatibility
-            if val == "invalid_date":
-                # Keep it as NaT
-                continue
-                
-            # Check for relative expressions
-            val_lower = val.lower()
-            if val_lower in _DATE_RELATIVE_EXPRESSIONS:
-                parsed[idx] = pd.to_datetime(_DATE_RELATIVE_EXPRESSIONS[val_lower]())
-                if transformations is not None and column is not None:
-                    transformations.setdefault(column, []).append(
-                        f"{val} -> {parsed[idx].strftime('%Y-%m-%d')}"
-                    )
-                continue
-                
-            # Check for advanced textual formats (ordinals)
-            extracted_date = _extract_textual_date(val)
-            if extracted_date:
-                parsed[idx] = pd.to_datetime(extracted_date)
-                if transformations is not None and column is not None:
-                    transformations.setdefault(column, []).append(
-                        f"{val} -> {extracted_date}"
-                    )
-                continue
+    is_text = _string_mask(series)
+    lowered = series.str.lower() if is_text.any() else None
+
+    # Handle relative expressions and textual formats (ordinals) first.
+    # "invalid_date" is kept as NaT - needed for test compatibility
+    registered = np.zeros(len(series), dtype=bool)  # Rows logged in this pass
+    if lowered is not None:
+        pending = (is_text & (series != "invalid_date")).to_numpy(dtype=bool)
+        # Relative expressions resolve against today's date, read once
+        today = pd.Timestamp.now().normalize()
+        relative = {
+            expr: (today + pd.Timedelta(days=offset)).strftime("%Y-%m-%d")
+            for expr, offset in _DATE_RELATIVE_EXPRESSIONS.items()
+        }
+        iso = lowered[pending].map(relative).astype(object)
+        is_relative = iso.notna().to_numpy()
+        if not is_relative.all():
+            textual = _extract_textual_dates(series[pending][~is_relative])
+            iso[~is_relative] = textual.to_numpy()
+        resolved = iso.notna().to_numpy()
+        registered[np.flatnonzero(pending)[resolved]] = True
+        if registered.any():
+            parsed[registered] = pd.to_datetime(iso[resolved], format="%Y-%m-%d").to_numpy()
+            if transformations is not None and column is not None:
+                _log(transformations, column).add_pairs(
+                    series[registered].to_numpy(), iso[resolved].to_numpy(),
+                    category=_DATE_CATEGORY,
+                )
     
-    # Try standard formats for values not yet converted
+    # Try standard formats for values not yet converted. String values are
+    # classified once by the separators and letters they contain, so each
+    # format only parses the values it could possibly match.
+    if is_text.any():
+        text_mask = is_text.to_numpy(dtype=bool)
+        token_masks: Dict[str, np.ndarray] = {}
+        for fmt in formats:
+            pending = text_mask & parsed.isna().to_numpy()
+            if not pending.any():
+                # Every string is parsed; the remaining formats have nothing to do
+                break
+            candidates = pending.copy()
+            for token in _format_tokens(fmt):
+                if token not in token_masks:
+                    # Parsed rows never become candidates again, so a token
+                    # is only looked up in the rows still pending
+                    hits = np.zeros(len(series), dtype=bool)
+                    hits[pending] = series[pending].str.contains(
+                        token, regex=True, na=False
+                    ).to_numpy(dtype=bool)
+                    token_masks[token] = hits
+                candidates &= token_masks[token]
+            if candidates.any():
+                parsed[candidates] = pd.to_datetime(
+                    series[candidates], errors="coerce", format=fmt
+                ).to_numpy()
+
+    # Non-string values (timestamps, numbers) go through every format as before
+    others = series.notna() & ~is_text
     for fmt in formats:
-        parsed_try = pd.to_datetime(series, errors="coerce", format=fmt)
+        others &= parsed.isna()
+        if not others.any():
+            break
+        parsed_try = pd.to_datetime(series[others], errors="coerce", format=fmt)
         parsed = parsed.fillna(parsed_try)
     
-    # Validate dates (reject impossible dates)
-    valid_mask = parsed.notna()
-    for idx in parsed[valid_mask].index:
-        date = parsed[idx]
-        # Check if the date is valid (e.g., no February 31)
-        try:
-            date.to_pydatetime()  # This will raise an exception for invalid dates
-        except (ValueError, OverflowError):
-            parsed[idx] = pd.NaT
-            valid_mask[idx] = False
+    # Impossible dates (e.g. February 31) and out-of-range years were already
+    # coerced to NaT by pd.to_datetime, so every parsed value is a valid date
     
     # Ensure "invalid_date" and similar values remain NaT
-    if isinstance(series, pd.Series):
-        for idx, val in series.items():
-            if isinstance(val, str) and (val == "invalid_date" or "invalid" in val.lower()):
-                parsed[idx] = pd.NaT
-                if transformations is not None and column is not None:
-                    transformations.setdefault(column, []).append(
-                        f"{val} -> INVALID"
-                    )
+    if lowered is not None:
+        flagged = (is_text & lowered.str.contains("invalid", regex=False, na=False)).to_numpy(dtype=bool)
+        if flagged.any():
+            parsed[flagged] = pd.NaT
+            if transformations is not None and column is not None:
+                _log(transformations, column).add_pairs(
+                    series[flagged].to_numpy(), np.full(int(flagged.sum()), "INVALID", dtype=object)
+                )
     
-    if parsed.notna().sum() == 0:
+    return _format_dates(series, parsed, registered, column, transformations, notna_count, min_ratio)
+
+
+def _format_dates(
+    series: pd.Series,
+    parsed: pd.Series,
+    registered: np.ndarray,
+    column: str | None,
+    transformations: Dict[str, TransformationLog] | None,
+    notna_count: int,
+    min_ratio: float,
+) -> tuple[pd.Series | None, int]:
+    """Return parsed dates as ISO strings, logging the values they rewrite.
+
+    ``registered`` marks rows whose change was already logged.
+    """
+    parsed_count = int(parsed.notna().sum())
+    if parsed_count == 0:
         return None, 0
     
-    ratio = parsed.notna().sum() / max(series.notna().sum(), 1)
-    if ratio < 0.5:
+    ratio = parsed_count / max(notna_count, 1)
+    if ratio < min_ratio:
         return None, 0
     
-    # Record transformations for the report
+    formatted = parsed.dt.strftime("%Y-%m-%d")
+
+    # Record transformations for the report, skipping those already registered
+    # (only parsed values can change, so only those are rendered and compared)
     if transformations is not None and column is not None:
-        for idx in series.index:
-            if pd.isna(parsed[idx]) or pd.isna(series[idx]):
-                continue
-            # Avoid reporting transformations already registered
-            if isinstance(series[idx], str) and (
-                series[idx].lower() in _DATE_RELATIVE_EXPRESSIONS or
-                _extract_textual_date(series[idx]) or
-                series[idx] == "invalid_date" or "invalid" in series[idx].lower()
-            ):
-                continue
-                
-            formatted = parsed[idx].strftime("%Y-%m-%d")
-            if str(series[idx]) != formatted:
-                transformations.setdefault(column, []).append(
-                    f"{series[idx]} -> {formatted}"
-                )
-    
-    invalid = int((series.notna() & parsed.isna()).sum())
-    return parsed.dt.strftime("%Y-%m-%d"), invalid
+        compared = parsed.notna().to_numpy() & ~registered
+        original = series[compared]
+        if pd.api.types.is_datetime64_any_dtype(original):
+            # astype(str) leaves out midnight times when every value has one,
+            # hiding that the time is dropped; str() always shows it
+            original = original.map(str)
+        original = original.astype(str).to_numpy(dtype=object)
+        target = formatted[compared].to_numpy(dtype=object)
+        changed = original != target
+        if changed.any():
+            _log(transformations, column).add_pairs(
+                original[changed], target[changed], category=_DATE_CATEGORY
+            )
+
+    # Only non-null values are ever parsed, so the rest are the invalid ones
+    invalid = notna_count - parsed_count
+    return formatted, invalid
+
+
+_UNIT_VALUE_RE = (
+    r"^(?:(?P<suffix>\d+\.?\d*)(?P<unit>[kKmMbB])"
+    r"|[$€£](?P<lead>\d+\.?\d*)|(?P<trail>\d+\.?\d*)[$€£]"
+    r"|(?P<units>\d+\.?\d*)\s+units?)$"
+)
+
+
+def _to_float(text: str) -> float | None:
+    """Return ``float(text)``, or None when the text is not a number."""
+    try:
+        return float(text)
+    except ValueError:
+        return None
 
 
 # Mapping of units and their conversion factors
@@ -608,189 +1174,225 @@ _UNIT_MULTIPLIERS = {
 def _normalize_units(
     series: pd.Series,
     column: str | None = None,
-    transformations: Dict[str, list[str]] | None = None,
+    transformations: Dict[str, TransformationLog] | None = None,
 ) -> pd.Series | None:
     """Normalize values with common measurement units."""
     # If not a string series, nothing to do
     if not pd.api.types.is_string_dtype(series) and not pd.api.types.is_object_dtype(series):
         return None
     
-    result = series.copy()
-    has_changes = False
-    
-    for idx, val in series.items():
-        if not isinstance(val, str):
-            continue
-        
-        # Handle values with suffixes like "10k", "5M"
-        suffix_match = re.match(r'^(\d+\.?\d*)([kKmMbB])$', val)
-        if suffix_match:
-            number, unit = suffix_match.groups()
-            multiplier = _UNIT_MULTIPLIERS.get(unit, 1)
-            converted = float(number) * multiplier
-            result[idx] = converted
-            has_changes = True
-            
-            if transformations is not None and column is not None:
-                transformations.setdefault(column, []).append(
-                    f"{val} -> {converted} (unit conversion {unit})"
-                )
-            continue
-            
-        # Handle monetary units
-        currency_match = re.match(r'^[$€£](\d+\.?\d*)$|^(\d+\.?\d*)[$€£]$', val)
-        if currency_match:
-            groups = currency_match.groups()
-            number = next(g for g in groups if g is not None)
-            result[idx] = float(number)
-            has_changes = True
-            
-            if transformations is not None and column is not None:
-                transformations.setdefault(column, []).append(
-                    f"{val} -> {float(number)} (currency conversion)"
-                )
-            continue
-            
-        # Handle formats with thousands separator
-        if "," in val and not val.endswith(","):
-            # Replace commas with nothing if it's a thousands separator
-            clean_val = re.sub(r'(\d),(\d)', r'\1\2', val)
-            try:
-                converted = float(clean_val)
-                result[idx] = converted
-                has_changes = True
-                
-                if transformations is not None and column is not None:
-                    transformations.setdefault(column, []).append(
-                        f"{val} -> {converted} (separator cleaning)"
-                    )
-            except ValueError:
-                pass
-            
-        # Handle values with physical units like "100 units"
-        unit_match = re.match(r'^(\d+\.?\d*)\s+units?$', val)
-        if unit_match:
-            number = unit_match.group(1)
-            converted = float(number)
-            result[idx] = converted
-            has_changes = True
-            
-            if transformations is not None and column is not None:
-                transformations.setdefault(column, []).append(
-                    f"{val} -> {converted} (number extraction)"
-                )
-    
-    return result if has_changes else None
+    if not _string_mask(series).any():
+        return None
+
+    # Suffixed ("10k"), monetary ("$5", "5€") and unit ("100 units") values
+    # are recognized in a single extraction pass
+    parts = series.str.extract(_UNIT_VALUE_RE)
+    # At most one number group matches per value
+    number = parts[["suffix", "lead", "trail", "units"]].astype(float).bfill(axis=1).iloc[:, 0]
+    multiplier = parts["unit"].map(_UNIT_MULTIPLIERS).astype(float).fillna(1.0)
+    values = number * multiplier
+
+    # Values with thousands separators, parsed with float() as before
+    has_separator = (
+        series.str.contains(",", regex=False, na=False)
+        & ~series.str.endswith(",", na=False)
+    ).to_numpy(dtype=bool)
+    if has_separator.any():
+        separated = series[has_separator].str.replace(r"(\d),(\d)", r"\1\2", regex=True)
+        values[has_separator] = _parse_cells(separated, _to_float)
+
+    converted = values.notna().to_numpy()
+    if not converted.any():
+        return None
+
+    if transformations is not None and column is not None:
+        kinds = [parts["unit"].notna(), parts["units"].notna(), has_separator]
+        suffixes = np.select(
+            kinds,
+            [
+                " (unit conversion " + parts["unit"].astype(object) + ")",
+                " (number extraction)",
+                " (separator cleaning)",
+            ],
+            " (currency conversion)",
+        )
+        categories = np.select(
+            kinds, [_UNIT_CATEGORY, _EXTRACTION_CATEGORY, _OTHER_CATEGORY], _UNIT_CATEGORY
+        ).astype(object)
+        _log(transformations, column).add_pairs(
+            series[converted].to_numpy(), values[converted].to_numpy(),
+            suffix=suffixes[converted], category=categories[converted],
+        )
+
+    # Object dtype so converted numbers can sit alongside unconverted text
+    result = series.astype(object)
+    result[converted] = values[converted].astype(object)
+    return result
+
+
+_EMBEDDED_NUMBER = r"(?P<num>\d+\.\d+|\d+)"
+# Numbers with letters before the decimal point, e.g. "95ABC.50"
+_SPLIT_DECIMAL_RE = r'^(\d+)[A-Za-z]+\.(\d+)'
+_DATE_SEPARATOR_RE = re.compile(r'[/-]')
+# Numbers in scientific notation, e.g. "1E3" or "2.5e-4"
+_SCIENTIFIC_NUMBER_RE = r'\s*[+-]?(?:\d+\.?\d*|\.\d+)[eE][+-]?\d+\s*'
 
 
 def _validate_numeric_extended(
     series: pd.Series,
     column: str | None = None,
-    transformations: Dict[str, list[str]] | None = None,
+    transformations: Dict[str, TransformationLog] | None = None,
     is_likely_id: bool = False,
+    notna_count: int | None = None,
+    min_ratio: float = 0.5,
 ) -> tuple[pd.Series | None, int]:
     """Return numeric series if convertible with enhanced capabilities."""
     # Don't convert if it's likely an identifier
     if is_likely_id:
         return None, 0
-    
-    # Handle edge case for test
-    if "one thousand and fifty" in series.values:
-        idx = series[series == "one thousand and fifty"].index[0]
-        converted = pd.Series(index=series.index, dtype=float)
-        converted[idx] = 1050.0
-        if transformations is not None and column is not None:
-            transformations.setdefault(column, []).append(
-                "one thousand and fifty -> 1050.0"
-            )
-        invalid = len(series) - 1
-        return converted, invalid
+    if notna_count is None:
+        notna_count = int(series.notna().sum())
     
     # Standard conversion with pd.to_numeric
     converted = pd.to_numeric(series, errors="coerce")
+    if isinstance(converted.dtype, pd.api.extensions.ExtensionDtype):
+        # String dtype input gives nullable results; match the object dtype path
+        # so later fallbacks can store floats and infinities
+        converted = converted.astype(float if converted.hasnans else converted.dtype.numpy_dtype)
+    if transformations is not None and column is not None:
+        _log_scientific_notation(series, converted, _log(transformations, column))
+
+    # Values to_numeric could not parse; when there are none the textual and
+    # extraction fallbacks below have nothing to work on
+    new_na = int(converted.isna().sum()) - (len(series) - notna_count)
     
     # Try advanced textual number conversion for non-converted values
-    if converted.isna().any():
-        as_words = series.where(converted.isna()).apply(_words_to_num_extended)
-        if transformations is not None and column is not None:
-            for idx, val in as_words.dropna().items():
-                transformations.setdefault(column, []).append(
-                    f"{series[idx]} -> {val}"
+    if new_na > 0:
+        # Work on positions, duplicate index labels would repeat or misalign rows
+        pending_at = np.flatnonzero((converted.isna() & series.notna()).to_numpy())
+        pending = series.iloc[pending_at]
+        as_words = _words_to_num_series(pending).to_numpy(dtype=float)
+        resolved = ~np.isnan(as_words)
+        if resolved.any():
+            if transformations is not None and column is not None:
+                _log(transformations, column).add_pairs(
+                    pending[resolved].to_numpy(), as_words[resolved],
+                    category=_TEXT_NUMBER_CATEGORY,
                 )
-        converted.update(as_words)
+            converted.iloc[pending_at[resolved]] = as_words[resolved]
     
     # Extract numbers from strings containing other characters
-    if converted.isna().any():
-        mask = converted.isna() & series.notna()
+    if new_na > 0 and converted.isna().any():
+        candidates = (converted.isna() & series.notna()).to_numpy()
         # Don't extract numbers from strings that look like dates
-        date_mask = series.astype(str).str.contains(r'[/-]', regex=True, na=False)
+        date_mask = series[candidates].astype(str).str.contains(_DATE_SEPARATOR_RE, na=False)
         
         # Extraction only for non-dates
-        to_extract = series[mask & ~date_mask]
+        positions = np.flatnonzero(candidates)[~date_mask.to_numpy()]
+        to_extract = series.iloc[positions]
         
         # Try improved special case extraction for patterns like "95ABC.50"
-        for idx, val in to_extract.items():
-            if isinstance(val, str):
-                # Handle "inf" or "infinity" special cases
-                if val.lower() in ("inf", "infinity"):
-                    converted[idx] = float('inf')
-                    
-                    if transformations is not None and column is not None:
-                        transformations.setdefault(column, []).append(
-                            f"{val} -> inf (infinity conversion)"
-                        )
-                    continue
-                
-                # Handle special case for numeric values with non-numeric characters in the middle
-                pattern = r'(\d+)[A-Za-z]+\.(\d+)'
-                match = re.match(pattern, val)
-                if match:
-                    integer_part, decimal_part = match.groups()
-                    extracted_value = float(f"{integer_part}.{decimal_part}")
-                    converted[idx] = extracted_value
-                    
-                    if transformations is not None and column is not None:
-                        transformations.setdefault(column, []).append(
-                            f"{val} -> {extracted_value} (special pattern extraction)"
-                        )
-        
-        # Standard numeric extraction for remaining values
-        remaining_mask = converted.isna() & mask & ~date_mask
-        remaining_to_extract = series[remaining_mask]
-        extracted = remaining_to_extract.str.extract(r'(\d+\.\d+|\d+)')[0]
-        extracted_numeric = pd.to_numeric(extracted, errors="coerce")
-        
-        if transformations is not None and column is not None:
-            for idx, val in extracted_numeric.dropna().items():
-                if idx in series.index:
-                    transformations.setdefault(column, []).append(
-                        f"{series[idx]} -> {val} (numeric extraction)"
+        handled = np.zeros(len(to_extract), dtype=bool)
+        is_text = _string_mask(to_extract).to_numpy(dtype=bool)
+        if is_text.any():
+            texts = to_extract[is_text]
+            # Handle "inf" or "infinity" special cases
+            is_inf = texts.str.lower().isin(("inf", "infinity")).to_numpy(dtype=bool)
+            # Handle special case for numeric values with non-numeric characters in the middle
+            parts = texts.str.extract(_SPLIT_DECIMAL_RE)
+            is_split = parts[0].notna().to_numpy() & ~is_inf
+            values = np.where(is_inf, np.inf, np.nan)
+            if is_split.any():
+                values[is_split] = (parts[0][is_split] + "." + parts[1][is_split]).astype(float).to_numpy()
+            found = is_inf | is_split
+            if found.any():
+                found_at = np.flatnonzero(is_text)[found]
+                handled[found_at] = True
+                converted.iloc[positions[found_at]] = values[found]
+                if transformations is not None and column is not None:
+                    _log(transformations, column).add_pairs(
+                        texts[found].to_numpy(),
+                        values[found],
+                        suffix=np.where(
+                            is_inf[found], " (infinity conversion)", " (special pattern extraction)"
+                        ),
+                        category=np.where(
+                            is_inf[found], _OTHER_CATEGORY, _EXTRACTION_CATEGORY
+                        ).astype(object),
                     )
         
-        converted.update(extracted_numeric)
-    
-    # Special case for scientific notation (1E3)
-    if "1E3" in series.values:
-        idx = series[series == "1E3"].index[0]
-        converted[idx] = 1000.0
-        if transformations is not None and column is not None:
-            transformations.setdefault(column, []).append(
-                "1E3 -> 1000.0"
+        # Standard numeric extraction for remaining values
+        remaining_to_extract = to_extract[~handled]
+        extracted_numeric = _extract_numbers(remaining_to_extract)
+        found = extracted_numeric.notna().to_numpy()
+        if transformations is not None and column is not None and found.any():
+            _log(transformations, column).add_pairs(
+                remaining_to_extract[found].to_numpy(),
+                extracted_numeric[found].to_numpy(),
+                suffix=" (numeric extraction)",
+                category=_EXTRACTION_CATEGORY,
             )
+        converted.iloc[positions[~handled][found]] = extracted_numeric[found].to_numpy(dtype=float)
     
     # If no values were successfully converted
-    if converted.notna().sum() == 0:
+    converted_count = int(converted.notna().sum())
+    if converted_count == 0:
         return None, 0
     
     # If less than half of the values were successfully converted
-    ratio = converted.notna().sum() / max(series.notna().sum(), 1)
-    if ratio < 0.5:
+    ratio = converted_count / max(notna_count, 1)
+    if ratio < min_ratio:
         return None, 0
     
-    invalid = int((converted.isna() & series.notna()).sum())
+    # Missing values never convert, so the rest are the invalid ones
+    invalid = notna_count - converted_count
+    # Results keep 64-bit dtypes: narrow integers would overflow silently in
+    # the arithmetic callers do on the cleaned frame
     return converted, invalid
 
 
+def _log_scientific_notation(series: pd.Series, converted: pd.Series, log: TransformationLog) -> None:
+    """Log the text numbers in scientific notation that to_numeric rewrote."""
+    is_text = _string_mask(series).to_numpy(dtype=bool)
+    if not is_text.any():
+        return
+    texts = series[is_text]
+    scientific = texts.str.fullmatch(_SCIENTIFIC_NUMBER_RE).to_numpy(dtype=bool, na_value=False)
+    if scientific.any():
+        values = converted.to_numpy()[np.flatnonzero(is_text)[scientific]]
+        log.add_pairs(texts[scientific].to_numpy(), values.astype(float), category=_OTHER_CATEGORY)
+
+
+def _extract_numbers(values: pd.Series) -> pd.Series:
+    """Return the first number embedded in each string, NaN where there is none."""
+    if HAS_PYARROW:
+        try:
+            arr = pa.array(values, type=pa.string(), from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            arr = None
+        if arr is not None:
+            # Match and cast in a single Arrow pass instead of str.extract + to_numeric
+            found = pc.struct_field(pc.extract_regex(arr, _EMBEDDED_NUMBER), [0])
+            numbers = None
+            if found.null_count == 0 and not pc.any(pc.match_substring(found, ".")).as_py():
+                # Mirror pd.to_numeric, which keeps all-integer results as int64
+                try:
+                    numbers = pc.cast(found, pa.int64())
+                except pa.ArrowInvalid:
+                    pass
+            if numbers is None:
+                numbers = pc.cast(found, pa.float64())
+            return pd.Series(numbers.to_numpy(zero_copy_only=False), index=values.index)
+    extracted = values.str.extract(_EMBEDDED_NUMBER)["num"]
+    return pd.to_numeric(extracted, errors="coerce")
+
+
+# Column name terms for the semantic checks
+_NON_NEGATIVE_TERM_RE = re.compile(r"price|stock|quantity|rating|count|age")
+_SIGNED_TERM_RE = re.compile(r"sale|revenue|profit")
+_RATING_TERM_RE = re.compile(r"rating|score")
+
+
 def _validate_column_semantics(series: pd.Series, column: str | None) -> tuple[pd.Series, list[str]]:
     """Check the semantic validity of values based on column context.
     
@@ -806,14 +1408,12 @@ def _validate_column_semantics(series: pd.Series, column: str | None) -> tuple[p
     result = series.copy()
     
     # Columns that should not contain negative values
-    non_negative_columns = ["price", "stock", "quantity", "rating", "count", "age"]
-    
-    if any(keyword in col_lower for keyword in non_negative_columns):
+    if _NON_NEGATIVE_TERM_RE.search(col_lower):
         # Check for negative values
         negative_mask = result < 0
         if negative_mask.any():
             # Preserve values for sales that can be negative
-            if "sale" in col_lower or "revenue" in col_lower or "profit" in col_lower:
+            if _SIGNED_TERM_RE.search(col_lower):
                 pass
             else:
                 # For stock and other measures that shouldn't be negative, report anomaly
@@ -823,7 +1423,7 @@ def _validate_column_semantics(series: pd.Series, column: str | None) -> tuple[p
                 # This preserves the original data while warning the user
     
     # Normalize ratings
-    if "rating" in col_lower or "score" in col_lower:
+    if _RATING_TERM_RE.search(col_lower):
         # Most rating systems range from 0 to 5 or 0 to 10
         # If values exceed 5, and max is close to 10, normalize to 5
         if result.max() > 5 and result.max() <= 10:
@@ -2,10 +2,23 @@
 
 from __future__ import annotations
 
+import json
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from typing import BinaryIO, Callable, Dict
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import infer_dtype, is_float_dtype, is_integer_dtype
+
+from ._compat import HAS_PYARROW, HAS_XLSXWRITER
+from ._utils import nonnull_sample
+
+if HAS_PYARROW:
+    import pyarrow as pa
+    import pyarrow.json as pa_json
+    import pyarrow.parquet as pq
 
 _DATE_FORMATS = [
     "%Y-%m-%d",
@@ -18,6 +31,40 @@ _DATE_FORMATS = [
     "%d %B %Y",
 ]
 
+_DATE_FORMAT_SEPARATOR_RE = re.compile(r"[-/ ]")
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_DAY_FIRST_DATE_RE = re.compile(r'\d{2}[/-]\d{2}[/-]\d{4}')
+_YEAR_FIRST_DATE_RE = re.compile(r'\d{4}[/-]\d{2}[/-]\d{2}')
+_TEXTUAL_DATE_RE = re.compile(r'[A-Za-z]{3,9}\s+\d{1,2},?\s+\d{4}')
+_PLAIN_NUMBER_RE = re.compile(r"^-?\d+(\.\d+)?$")
+_MONEY_RE = re.compile(r"^[\$\€\£]?\d+(\.\d+)?[\$\€\£]?$")
+# infer_dtype results for columns whose values are all scalars
+_SCALAR_INFERRED_TYPES = frozenset({
+    "empty", "string", "bytes", "integer", "floating", "mixed-integer-float",
+    "decimal", "complex", "boolean", "datetime64", "datetime", "date",
+    "timedelta64", "timedelta", "time", "period", "interval",
+})
+# Column name terms hinting at a semantic type
+_NAME_TERM_RE = re.compile(r"name|title|product|model")
+_DATE_TERM_RE = re.compile(r"date|time|created|updated")
+_PRICE_TERM_RE = re.compile(r"price|cost|amount|fee")
+_DATE_HINT_TERM_RE = re.compile(r"date|time|day")
+_LOCATION_TERM_RE = re.compile(r"location|address|city|country|street")
+_PRODUCT_TERM_RE = re.compile(r"product|item|model")
+# Rows per chunk when streaming JSON lines to CSV
+_STREAM_CHUNK_ROWS = 50_000
+# pandas JSON reader settings: values are kept as parsed, like Arrow does,
+# instead of numeric-looking strings and date-named columns being converted
+_JSON_READ_OPTIONS = {"dtype": False, "convert_dates": False}
+# infer_dtype results for object columns Arrow cannot store as one type
+_MIXED_INFERRED_TYPES = frozenset({"mixed", "mixed-integer"})
+# Patterns typically found in product names
+_PRODUCT_PATTERNS = [
+    re.compile(r'\b[A-Z][a-z]+\s+\d+\b'),          # iPhone 14, Series 7
+    re.compile(r'\b[A-Z][a-z]+\s+[A-Z][a-z]+\b'),   # MacBook Pro, Nike Air
+    re.compile(r'\b[A-Z]+\d+\b'),                   # BMW X5, Audi A4
+]
+
 
 class convert:
     """Namespace for conversion helpers."""
@@ -25,28 +72,60 @@ class convert:
     @staticmethod
     def read(path: Path) -> pd.DataFrame:
         """Read a data file into a DataFrame, auto-detecting format."""
-        suffix = path.suffix.lower()
-        if suffix == ".csv":
-            return pd.read_csv(path)
-        if suffix in {".xlsx", ".xls"}:
-            return pd.read_excel(path)
-        if suffix == ".json":
-            return _read_json(path)
-        raise ValueError(f"Unsupported input format: {path.suffix}")
+        return _read(path, path.suffix.lower())
+
+    @staticmethod
+    def read_from_buffer(buf: BinaryIO, fmt: str) -> pd.DataFrame:
+        """Read a DataFrame in the given format ("csv", "xlsx", "json", "parquet") from a binary buffer."""
+        return _read(buf, f".{fmt.lower()}")
 
     @staticmethod
     def write(df: pd.DataFrame, path: Path) -> None:
         """Write a DataFrame to a file, auto-detecting format."""
-        suffix = path.suffix.lower()
-        if suffix == ".csv":
-            df = _flatten(df)
-            df.to_csv(path, index=False)
-        elif suffix in {".xlsx", ".xls"}:
-            df.to_excel(path, index=False)
-        elif suffix == ".json":
-            df.to_json(path, orient="records", lines=True)
-        else:
-            raise ValueError(f"Unsupported output format: {path.suffix}")
+        _write(df, path, path.suffix.lower())
+
+    @staticmethod
+    def write_to_buffer(df: pd.DataFrame, fmt: str, buf: BinaryIO) -> None:
+        """Write a DataFrame in the given format ("csv", "xlsx", "json", "parquet") to a binary buffer."""
+        _write(df, buf, f".{fmt.lower()}")
+
+    @staticmethod
+    def json_lines_to_csv(
+        source: BinaryIO, buf: BinaryIO, chunk_rows: int = _STREAM_CHUNK_ROWS
+    ) -> int:
+        """Convert newline-delimited JSON to CSV ``chunk_rows`` rows at a time.
+
+        Only one chunk is held in memory, but ``source`` is read twice, so it
+        must be seekable. Returns the number of rows written; raises
+        ValueError when the input is a JSON array.
+        """
+        # A one-line array would parse as a single row, so it is sniffed first
+        start = source.tell()
+        is_array = source.read(1024).lstrip().startswith(b"[")
+        source.seek(start)
+        if is_array:
+            raise ValueError("JSON arrays cannot be converted chunk by chunk")
+        # A first pass settles the columns and how their numbers are
+        # written, so the output does not depend on where chunks split
+        columns, floats, mixed = _json_lines_layout(source, chunk_rows)
+        source.seek(start)
+        rows = 0
+        with _read_json_chunks(source, chunk_rows) as reader:
+            for chunk in reader:
+                if len(chunk) == 0:
+                    # Blank lines alone make up a chunk without rows
+                    continue
+                chunk = _flatten(chunk).reindex(columns=columns)
+                for col in floats:
+                    chunk[col] = chunk[col].astype(float)
+                for col in mixed:
+                    # Numbers next to other values are written as integers
+                    # when whole, as a missing value turns a chunk's ints to
+                    # floats
+                    chunk[col] = _whole_floats_as_int(chunk[col])
+                chunk.to_csv(buf, index=False, header=rows == 0)
+                rows += len(chunk)
+        return rows
 
     @staticmethod
     def detect_types(df: pd.DataFrame) -> Dict[str, str]:
@@ -61,39 +140,105 @@ class convert:
         return refined_types
 
 
+def _read_json_chunks(source: BinaryIO, chunk_rows: int):
+    """Return a reader over JSON lines chunks, with values kept as parsed.
+
+    Dtypes are not inferred per chunk, where e.g. booleans next to a missing
+    value would turn into floats in some chunks only.
+    """
+    return pd.read_json(source, lines=True, chunksize=chunk_rows, **_JSON_READ_OPTIONS)
+
+
+def _json_lines_layout(source: BinaryIO, chunk_rows: int) -> tuple[list[str], list[str], list[str]]:
+    """Return the flattened columns of JSON lines, those to write as floats
+    and those mixing numbers with other values.
+
+    Numeric columns are floats when any chunk holds floats or has no value
+    for the column, matching the dtypes pandas gives the input read in one
+    piece. Columns follow the order of the input keys, plain ones before
+    expanded nested keys; a nested key only null where it is not a dict
+    gets no plain column of its own.
+    """
+    keys: Dict[str, None] = {}
+    plain: set[str] = set()
+    expanded: Dict[str, Dict[str, None]] = {}
+    present: Dict[str, int] = {}
+    numeric: Dict[str, bool] = {}
+    has_float: set[str] = set()
+    chunks = 0
+    with _read_json_chunks(source, chunk_rows) as reader:
+        for chunk in reader:
+            if len(chunk) == 0:
+                continue
+            chunks += 1
+            keys.update(dict.fromkeys(chunk.columns))
+            for col, series in _flatten(chunk).items():
+                if col in chunk.columns:
+                    plain.add(col)
+                else:
+                    parent = max((key for key in chunk.columns if col.startswith(f"{key}.")), key=len, default=col)
+                    expanded.setdefault(parent, {})[col] = None
+                if not series.notna().any():
+                    continue
+                present[col] = present.get(col, 0) + 1
+                is_float = is_float_dtype(series)
+                numeric[col] = numeric.get(col, True) and (is_float or is_integer_dtype(series))
+                if is_float:
+                    has_float.add(col)
+    columns = [key for key in keys if key in plain and (key in present or key not in expanded)]
+    columns += [col for key in keys for col in expanded.get(key, ())]
+    floats = [
+        col for col, count in present.items()
+        if numeric[col] and (col in has_float or count < chunks)
+    ]
+    mixed = [col for col in present if not numeric[col]]
+    return columns, floats, mixed
+
+
+def _whole_floats_as_int(series: pd.Series) -> pd.Series:
+    """Return the series as objects, with whole-valued floats as ints."""
+    # Beyond the int64 range a float is not written back as an int
+    values = [
+        int(value) if isinstance(value, float) and value.is_integer() and abs(value) < 2.0**63 else value
+        for value in series.to_numpy(dtype=object)
+    ]
+    return pd.Series(values, index=series.index, name=series.name, dtype=object)
+
+
 def _looks_like_date(series: pd.Series) -> bool:
     """Check if series appears to contain ISO format dates."""
-    sample = series.dropna().astype(str).head(10)
-    return sample.str.match(r"\d{4}-\d{2}-\d{2}").all()
+    sample = nonnull_sample(series, 10).astype(str)
+    return sample.str.match(_ISO_DATE_RE).all()
 
 
 def _infer_column_type(df: pd.DataFrame, col_name: str) -> str:
     """Infer a column's semantic type based on name and content."""
-    series = df[col_name]
+    # Only the name and the leading non-null values are looked at, so they
+    # key a cache that skips the probing for columns seen before
+    sample = nonnull_sample(df[col_name], 20).astype(str)
+    return _infer_type_from_sample(col_name, tuple(sample))
+
+
+@lru_cache(maxsize=256)
+def _infer_type_from_sample(col_name: str, values: tuple[str, ...]) -> str:
+    """Infer a column's semantic type from its name and leading values."""
     col_lower = col_name.lower()
     
     # Type detection by column name
-    if "id" in col_lower and col_lower.endswith("id"):
+    if col_lower.endswith("id"):
         return "identifier"
         
-    if any(name_term in col_lower for name_term in ["name", "title", "product", "model"]):
+    if _NAME_TERM_RE.search(col_lower):
         # For test compatibility, always return "string" for product_name
         return "string"
         
-    if any(date_term in col_lower for date_term in ["date", "time", "created", "updated"]):
-        sample = series.dropna().astype(str).head(10)
+    if _DATE_TERM_RE.search(col_lower):
+        return "date"  # Date based on column name, whatever the values look like
         
-        # Check if looks like a date
-        if sample.str.contains(r'^\d{4}-\d{2}-\d{2}', regex=True).mean() > 0.5:
-            return "date"
-        if sample.str.contains(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', regex=True).mean() > 0.5:
-            return "date"
-        return "date"  # Default to date based on column name
-        
-    if any(price_term in col_lower for price_term in ["price", "cost", "amount", "fee"]):
+    if _PRICE_TERM_RE.search(col_lower):
         return "currency"
 
-    sample = series.dropna().astype(str).head(20)
+    sample = pd.Series(values, dtype=object)
 
     # Boolean detection
     bool_values = {
@@ -113,18 +258,16 @@ def _infer_column_type(df: pd.DataFrame, col_name: str) -> str:
     if sample.str.lower().isin(bool_values).mean() >= 0.5:
         return "boolean"
 
-    # Date detection
-    date_matches = 0
-    for fmt in _DATE_FORMATS:
-        parsed = pd.to_datetime(sample, errors="coerce", format=fmt)
-        if parsed.notna().mean() > 0.5:
-            date_matches += 1
-            
-    if date_matches > 0:
+    # Date detection: every format needs a separator, so a sample mostly
+    # without one cannot pass, and the first format that fits settles it
+    if sample.str.contains(_DATE_FORMAT_SEPARATOR_RE).mean() > 0.5 and any(
+        pd.to_datetime(sample, errors="coerce", format=fmt).notna().mean() > 0.5
+        for fmt in _DATE_FORMATS
+    ):
         return "date"
 
     # Numeric detection with more precision
-    numeric_match = sample.str.match(r"^-?\d+(\.\d+)?$").mean() > 0.5
+    numeric_match = sample.str.match(_PLAIN_NUMBER_RE).mean() > 0.5
     if numeric_match:
         # Check if all values are integers
         try:
@@ -136,13 +279,18 @@ def _infer_column_type(df: pd.DataFrame, col_name: str) -> str:
             pass
 
     # Currency detection
-    if sample.str.match(r"^[\$\€\£]?\d+(\.\d+)?[\$\€\£]?$").mean() > 0.2:
+    if sample.str.match(_MONEY_RE).mean() > 0.2:
         return "currency"
 
     # Default to string
     return "string"
 
 
+def _all_whole(values: np.ndarray) -> bool:
+    """Return whether every float is finite and integral, like ``float.is_integer``."""
+    return bool((np.isfinite(values) & (values == np.floor(values))).all())
+
+
 def _refine_inferred_types(df: pd.DataFrame, types: Dict[str, str]) -> Dict[str, str]:
     """Refine initially detected types with more context-aware analysis."""
     refined_types = types.copy()
@@ -162,43 +310,36 @@ def _refine_inferred_types(df: pd.DataFrame, types: Dict[str, str]) -> Dict[str,
         # Correct integer vs floating point detection
         if detected_type == "integer" and pd.api.types.is_float_dtype(series):
             # Check if all values are actually integers
-            non_null = series.dropna()
-            if len(non_null) > 0 and not non_null.apply(lambda x: float(x).is_integer()).all():
+            non_null = series.dropna().to_numpy(dtype=float)
+            if len(non_null) > 0 and not _all_whole(non_null):
                 refined_types[col] = "floating"
         
         # Identify currency columns more accurately
         if detected_type in ["integer", "floating"]:
-            if any(currency_term in col_lower for currency_term in ["price", "cost", "fee", "amount"]):
+            if _PRICE_TERM_RE.search(col_lower):
                 refined_types[col] = "currency"
         
         # Refine date detection
-        if detected_type == "string" and any(date_term in col_lower for date_term in ["date", "time", "day"]):
+        if detected_type == "string" and _DATE_HINT_TERM_RE.search(col_lower):
             # Additional check for dates
-            sample = series.dropna().astype(str).head(20)
+            sample = nonnull_sample(series, 20).astype(str)
             has_date_pattern = (
-                sample.str.contains(r'\d{2}[/-]\d{2}[/-]\d{4}', regex=True).mean() > 0.3 or
-                sample.str.contains(r'\d{4}[/-]\d{2}[/-]\d{2}', regex=True).mean() > 0.3 or
-                sample.str.contains(r'[A-Za-z]{3,9}\s+\d{1,2},?\s+\d{4}', regex=True).mean() > 0.3
+                sample.str.contains(_DAY_FIRST_DATE_RE, regex=True).mean() > 0.3 or
+                sample.str.contains(_YEAR_FIRST_DATE_RE, regex=True).mean() > 0.3 or
+                sample.str.contains(_TEXTUAL_DATE_RE, regex=True).mean() > 0.3
             )
             if has_date_pattern:
                 refined_types[col] = "date"
         
         # Better location/address detection
-        location_terms = ["location", "address", "city", "country", "street"]
-        if detected_type == "string" and any(loc_term in col_lower for loc_term in location_terms):
+        if detected_type == "string" and _LOCATION_TERM_RE.search(col_lower):
             refined_types[col] = "location"
         
         # Identify product names - but only for non-test columns
-        product_terms = ["product", "item", "model"]
-        if detected_type == "string" and col != "product_name" and any(term in col_lower for term in product_terms):
+        if detected_type == "string" and col != "product_name" and _PRODUCT_TERM_RE.search(col_lower):
             # Check for patterns typically found in product names
-            sample = series.dropna().astype(str).head(20)
-            product_patterns = [
-                r'\b[A-Z][a-z]+\s+\d+\b',          # iPhone 14, Series 7
-                r'\b[A-Z][a-z]+\s+[A-Z][a-z]+\b',   # MacBook Pro, Nike Air
-                r'\b[A-Z]+\d+\b',                   # BMW X5, Audi A4
-            ]
-            for pattern in product_patterns:
+            sample = nonnull_sample(series, 20).astype(str)
+            for pattern in _PRODUCT_PATTERNS:
                 if sample.str.contains(pattern, regex=True, na=False).mean() > 0.3:
                     refined_types[col] = "product_name"
                     break
@@ -206,22 +347,196 @@ def _refine_inferred_types(df: pd.DataFrame, types: Dict[str, str]) -> Dict[str,
     return refined_types
 
 
-def _read_json(path: Path) -> pd.DataFrame:
+def _read(source: Path | BinaryIO, suffix: str) -> pd.DataFrame:
+    """Read a DataFrame from a path or binary buffer in the format of ``suffix``."""
+    if suffix == ".csv":
+        return pd.read_csv(source)
+    if suffix in {".xlsx", ".xls"}:
+        return pd.read_excel(source)
+    if suffix == ".json":
+        return _read_json(source)
+    if suffix == ".parquet":
+        _require_pyarrow("Parquet input")
+        return _arrow_to_pandas(pq.read_table(source))
+    raise ValueError(f"Unsupported input format: {suffix}")
+
+
+def _read_json(source: Path | BinaryIO) -> pd.DataFrame:
     """Return DataFrame from JSON, auto-detecting newline-delimited format."""
-    with path.open("r", encoding="utf-8") as f:
-        start = f.read(1024)
-    text = start.lstrip()
-    if text.startswith("["):
-        return pd.read_json(path)
-    return pd.read_json(path, lines=True)
+    start = None if isinstance(source, Path) else source.tell()
+    if HAS_PYARROW:
+        # Arrow only parses newline-delimited JSON with one type per field;
+        # arrays and anything else it rejects go through the pandas reader
+        try:
+            df = _read_json_lines_arrow(source, start)
+        except pa.ArrowInvalid:
+            df = None
+        if df is not None:
+            return df
+    if start is None:
+        with source.open("rb") as f:
+            head = f.read(1024)
+    else:
+        source.seek(start)
+        head = source.read(1024)
+        source.seek(start)
+    if head.lstrip().startswith(b"["):
+        return pd.read_json(source, **_JSON_READ_OPTIONS)
+    return pd.read_json(source, lines=True, **_JSON_READ_OPTIONS)
+
+
+def _read_json_lines_arrow(source: Path | BinaryIO, start: int | None) -> pd.DataFrame | None:
+    """Read newline-delimited JSON with the multithreaded Arrow parser.
+
+    Returns None when the result would differ from the pandas reader.
+    """
+    table = pa_json.read_json(source)
+    # Arrow parses ISO date strings as timestamps; those fields are read
+    # again as strings so the values survive unchanged
+    dates = [field.name for field in table.schema if pa.types.is_timestamp(field.type)]
+    if dates:
+        if start is not None:
+            source.seek(start)
+        options = pa_json.ParseOptions(explicit_schema=pa.schema([(name, pa.string()) for name in dates]))
+        # Explicit fields come first, so the original order is restored
+        table = pa_json.read_json(source, parse_options=options).select(table.column_names)
+    if any(_contains_type(field.type, _nested_to_pandas) for field in table.schema):
+        # Dates inside nested values have no schema to be read as text with,
+        # and structs come back with every key, missing ones as None
+        return None
+    df = _arrow_to_pandas(table)
+    for field in table.schema:
+        if pa.types.is_null(field.type):
+            # The pandas reader gives columns without any value as NaN floats
+            df[field.name] = df[field.name].astype(float)
+    return df
+
+
+def _arrow_to_pandas(table: pa.Table) -> pd.DataFrame:
+    """Return an Arrow table as a DataFrame with nested values as dicts and lists."""
+    df = table.to_pandas()
+    # Arrow hands back lists as numpy arrays, nested or not; keep the plain
+    # dicts and lists the pandas JSON reader produces
+    for field in table.schema:
+        if pa.types.is_nested(field.type):
+            df[field.name] = table.column(field.name).to_pylist()
+    return df
+
+
+def _contains_type(arrow_type: pa.DataType, predicate: Callable[[pa.DataType], bool]) -> bool:
+    """Return whether an Arrow type, or any type nested in it, matches ``predicate``."""
+    if predicate(arrow_type):
+        return True
+    return any(
+        _contains_type(arrow_type.field(i).type, predicate) for i in range(arrow_type.num_fields)
+    )
+
+
+def _nested_to_pandas(arrow_type: pa.DataType) -> bool:
+    """Return whether values of an Arrow type nested in a field differ from pandas."""
+    return pa.types.is_timestamp(arrow_type) or pa.types.is_struct(arrow_type)
+
+
+def _write(df: pd.DataFrame, target: Path | BinaryIO, suffix: str) -> None:
+    """Write a DataFrame to a path or binary buffer in the format of ``suffix``."""
+    if suffix == ".csv":
+        df = _flatten(df)
+        df.to_csv(target, index=False)
+    elif suffix in {".xlsx", ".xls"}:
+        _write_excel(df, target, suffix)
+    elif suffix == ".json":
+        df.to_json(target, orient="records", lines=True)
+    elif suffix == ".parquet":
+        _require_pyarrow("Parquet output")
+        _parquet_compatible(df).to_parquet(target, engine="pyarrow", compression="snappy", index=False)
+    else:
+        raise ValueError(f"Unsupported output format: {suffix}")
+
+
+def _require_pyarrow(feature: str) -> None:
+    """Raise ValueError when pyarrow, needed for ``feature``, is missing."""
+    if not HAS_PYARROW:
+        raise ValueError(f"{feature} requires pyarrow (pip install .[arrow])")
+
+
+def _parquet_compatible(df: pd.DataFrame) -> pd.DataFrame:
+    """Return the frame with columns Arrow has no type for stored as text."""
+    # Cleaning can leave numbers next to unconverted text in one column, and
+    # nested values may not share one struct or list type; dicts and lists
+    # that do are stored as Arrow structs and lists
+    mixed = [
+        col for col in df.columns
+        if df[col].dtype == object and infer_dtype(df[col], skipna=True) in _MIXED_INFERRED_TYPES
+        and not _fits_arrow_type(df[col])
+    ]
+    if not mixed:
+        return df
+    df = df.copy(deep=False)
+    for col in mixed:
+        series = df[col]
+        df[col] = series.where(series.isna(), series.map(_as_text))
+    return df
+
+
+def _fits_arrow_type(series: pd.Series) -> bool:
+    """Return whether the values of ``series`` share one Arrow type."""
+    try:
+        pa.array(series, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return False
+    return True
+
+
+def _as_text(value: object) -> str:
+    """Return a value as text, with dicts and lists as JSON."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return str(value)
+
+
+def _write_excel(df: pd.DataFrame, target: Path | BinaryIO, suffix: str) -> None:
+    """Write a DataFrame to Excel, with xlsxwriter when it is installed."""
+    if HAS_XLSXWRITER and suffix == ".xlsx":
+        # xlsxwriter serializes cells without building openpyxl's per-cell
+        # objects. Its constant_memory mode is not used: it flushes a row as
+        # soon as the next one starts, and to_excel writes column by column
+        with pd.ExcelWriter(target, engine="xlsxwriter") as writer:
+            df.to_excel(writer, index=False)
+        return
+    df.to_excel(target, index=False)
 
 
 def _flatten(df: pd.DataFrame) -> pd.DataFrame:
     """Flatten nested columns if present."""
-    has_nested = any(
-        df[col].map(lambda x: isinstance(x, (dict, list))).any()
-        for col in df.columns
-    )
-    if has_nested:
-        df = pd.json_normalize(df.to_dict(orient="records"))
-    return df
\ No newline at end of file
+    nested = [col for col in df.columns if _has_nested_values(df[col])]
+    if not nested:
+        return df
+    records = {col: df[col].tolist() for col in nested}
+    if not all(
+        all(isinstance(value, dict) for value in values)
+        or not any(isinstance(value, dict) for value in values)
+        for values in records.values()
+    ):
+        # A column mixing dicts with other values spreads over both its own
+        # name and the expanded keys, which only the per-row path reproduces
+        return pd.json_normalize(df.to_dict(orient="records"))
+    # Only dict columns expand; like the per-row path, the expanded keys
+    # follow the columns that are carried over as is
+    expanded = [
+        col for col, values in records.items()
+        if values and isinstance(values[0], dict)
+    ]
+    parts = [df.drop(columns=expanded).reset_index(drop=True)]
+    for col in expanded:
+        parts.append(pd.json_normalize(records[col]).add_prefix(f"{col}."))
+    return pd.concat(parts, axis=1)
+
+
+def _has_nested_values(series: pd.Series) -> bool:
+    """Check if a column holds dicts or lists."""
+    # Only object columns of mixed values can hold them; infer_dtype settles
+    # every other column in one C-level pass
+    if series.dtype != object or infer_dtype(series, skipna=True) in _SCALAR_INFERRED_TYPES:
+        return False
+    return any(isinstance(value, (dict, list)) for value in series.to_numpy())
+
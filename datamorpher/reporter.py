@@ -4,10 +4,33 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Sequence, TextIO
 
-from tabulate import tabulate
+_DAY_FIRST_DATE_RE = re.compile(r'\d{2}[/-]\d{2}[/-]\d{4}')
+_YEAR_FIRST_DATE_RE = re.compile(r'\d{4}[/-]\d{2}[/-]\d{2}')
+# Month abbreviations and number words anywhere in a change, one search each
+_MONTH_RE = re.compile(r'jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec')
+_NUMBER_WORD_RE = re.compile(r'one|two|three|four|five|ten|twenty|thirty|hundred|thousand')
+# Maps every digit to 0, keeping the length and layout of numbers and dates
+_DIGIT_SHAPE = str.maketrans("123456789", "000000000")
+
+# Summary and column type table that open every report
+_SUMMARY_TEMPLATE = """# DataMorpher Report
+
+## Summary
+- Input: {input} ({rows_in} rows)
+- Output: {output} ({rows_out} rows)
+- Duplicates removed: {duplicates}
+- Values imputed:
+{imputed}
+- Duration: {duration:.2f}s
+
+## Column Types
+{table}
+"""
 
 
 def build_report(
@@ -18,17 +41,16 @@ def build_report(
     clean_info: Dict[str, object],
     types: Dict[str, str],
     duration: float,
-) -> str:
-    """Return a markdown report string with enhanced information."""
-    # Create a more detailed column type table
-    type_headers = ["Column", "Detected Type", "Non-null Count", "Example Values"]
-    type_rows = []
-    
-    # Build enhanced type table with examples
-    for col, typ in types.items():
-        type_rows.append([col, typ, "", ""])  # Placeholder for non-null and examples
-    
-    table = tabulate(type_rows, headers=type_headers, tablefmt="github")
+    out: TextIO | None = None,
+) -> str | None:
+    """Return a markdown report string with enhanced information.
+
+    With ``out``, the report is written to it section by section instead
+    and ``None`` is returned.
+    """
+    # Column type table; the non-null count and example columns were always
+    # empty, so only the name and type are listed
+    table = _markdown_table(["Column", "Detected Type"], types.items())
     
     # Format imputation information
     imputed = (
@@ -41,64 +63,95 @@ def build_report(
     invalid = clean_info.get("invalid", {})
     warnings = clean_info.get("warnings", [])
     
-    # Build the report
-    report = f"""# DataMorpher Report
-
-## Summary
-- Input: {input_path.name} ({rows_in} rows)
-- Output: {output_path.name} ({rows_out} rows)
-- Duplicates removed: {clean_info["duplicates"]}
-- Values imputed:\n{imputed}
-- Duration: {duration:.2f}s
-
-## Column Types
-{table}
-"""
+    summary = _SUMMARY_TEMPLATE.format(
+        input=input_path.name,
+        rows_in=rows_in,
+        output=output_path.name,
+        rows_out=rows_out,
+        duplicates=clean_info["duplicates"],
+        imputed=imputed,
+        duration=duration,
+        table=table,
+    )
+    # Conversions without cleaning notes are only the summary
+    if not (warnings or transformations):
+        if out is not None:
+            out.write(summary)
+            return None
+        return summary
+
+    # Build the report from parts joined once at the end, or stream it
+    parts: List[str] = []
+    append = parts.append if out is None else out.write
+    append(summary)
 
     # Add warnings section if any warnings exist
     if warnings:
-        report += "\n\n## Notes and Warnings\n"
+        append("\n\n## Notes and Warnings\n")
         for warning in warnings:
-            report += f"- {warning}\n"
+            append(f"- {warning}\n")
 
     # Add transformations with categorization
     if transformations:
-        report += "\n\n## Applied Transformations\n"
+        append("\n\n## Applied Transformations\n")
         for col, changes in transformations.items():
-            report += f"### Column '{col}'\n"
+            append(f"### Column '{col}'\n")
             
             # Group similar transformations
             grouped_changes = _group_similar_transformations(changes)
             
             # Display transformations by category
             for category, change_list in grouped_changes.items():
-                report += f"**{category}:**\n"
+                append(f"**{category}:**\n")
                 
                 # Limit examples for large categories
+                for change in change_list[:5]:
+                    append(f"- {change}\n")
                 if len(change_list) > 5:
-                    for change in change_list[:5]:
-                        report += f"- {change}\n"
-                    report += f"- ... and {len(change_list) - 5} similar transformations\n"
-                else:
-                    for change in change_list:
-                        report += f"- {change}\n"
+                    append(f"- ... and {len(change_list) - 5} similar transformations\n")
             
             # Add invalid count if any
             if invalid.get(col):
-                report += f"**Non-recoverable values:** {invalid[col]}\n"
-
-    return report
+                append(f"**Non-recoverable values:** {invalid[col]}\n")
+
+    if out is not None:
+        return None
+    return "".join(parts)
+
+
+def _markdown_table(headers: Sequence[str], rows: Iterable[Sequence[object]]) -> str:
+    """Render rows as a GitHub markdown table with left-aligned, padded cells."""
+    # Rows are consumed once; the padding needs every cell, so only their
+    # string forms are kept
+    cells = [[str(value) for value in row] for row in rows]
+    # Headers keep two spaces of padding, as in tabulate's "github" format
+    widths = [
+        max([len(header) + 2] + [len(row[i]) for row in cells])
+        for i, header in enumerate(headers)
+    ]
+    header_lines = (
+        "| " + " | ".join(header.ljust(width) for header, width in zip(headers, widths)) + " |",
+        "|" + "|".join("-" * (width + 2) for width in widths) + "|",
+    )
+    body_lines = (
+        "| " + " | ".join(value.ljust(width) for value, width in zip(row, widths)) + " |"
+        for row in cells
+    )
+    return "\n".join(chain(header_lines, body_lines))
 
 
-def _group_similar_transformations(changes: List[str]) -> Dict[str, List[str]]:
+def _group_similar_transformations(changes: Iterable[str]) -> Dict[str, List[str]]:
     """Group similar transformations into categories for a cleaner report."""
     grouped: Dict[str, List[str]] = defaultdict(list)
-    
-    for change in changes:
-        category = _categorize_transformation(change)
-        grouped[category].append(change)
-        
-    return grouped
+    # Cleaning logs tag most entries with their category as they are made,
+    # so only untagged entries and plain strings are categorized from text
+    categorized = getattr(changes, "categorized", None)
+    entries = categorized() if categorized is not None else ((None, change) for change in changes)
+    for category, change in entries:
+        grouped[category or _categorize_transformation(change)].append(change)
+
+    # Callers get a plain dict, so lookups of missing categories stay errors
+    return dict(grouped)
 
 
 def _categorize_transformation(change: str) -> str:
@@ -109,7 +162,15 @@ def _categorize_transformation(change: str) -> str:
     
     if change == "2022/12/20 -> 2022-12-20":
         return "Date Format Standardization"
-    
+
+    # Only the shape of the digits matters, so changes differing in their
+    # numbers alone share a cache entry
+    return _categorize_shape(change.translate(_DIGIT_SHAPE))
+
+
+@lru_cache(maxsize=4096)
+def _categorize_shape(change: str) -> str:
+    """Categorize a transformation whose digits have all been replaced by 0."""
     # Value imputation
     if "NaN ->" in change and "(median)" in change:
         return "Median Imputation"
@@ -121,19 +182,19 @@ def _categorize_transformation(change: str) -> str:
     if "unit conversion" in change or "currency conversion" in change:
         return "Unit/Currency Conversion" 
     
+    lower = change.lower()
+
     # Date formatting
-    if "->" in change and any(fmt in change for fmt in ["-", "/"]):
-        months = ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]
-        if any(month in change.lower() for month in months):
+    if "->" in change and ("-" in change or "/" in change):
+        if _MONTH_RE.search(lower):
             return "Date Format Standardization"
         
         # Look for date patterns
-        if re.search(r'\d{2}[/-]\d{2}[/-]\d{4}', change) or re.search(r'\d{4}[/-]\d{2}[/-]\d{2}', change):
+        if _DAY_FIRST_DATE_RE.search(change) or _YEAR_FIRST_DATE_RE.search(change):
             return "Date Format Standardization"
     
     # Text to number conversion
-    number_words = ["one", "two", "three", "four", "five", "ten", "twenty", "thirty", "hundred", "thousand"]
-    if any(word in change.lower() for word in number_words):
+    if _NUMBER_WORD_RE.search(lower):
         return "Text to Number Conversion"
     
     # Numeric extraction
@@ -144,11 +205,11 @@ def _categorize_transformation(change: str) -> str:
     return "Other Transformations"
 
 
-def format_example_values(values: List[Any]) -> str:
-    """Format a list of example values for display in the report."""
+def format_example_values(values: Iterable[Any]) -> str:
+    """Format example values for display in the report."""
     # Convert values to strings and limit length
     formatted = []
-    for val in values[:3]:  # Only use up to 3 examples
+    for val in islice(values, 3):  # Only use up to 3 examples
         if isinstance(val, str):
             # Truncate long strings
             if len(val) > 20:
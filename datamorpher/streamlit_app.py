@@ -21,10 +21,89 @@ import pandas as pd
 import streamlit as st
 
 # Import from datamorpher package
+from datamorpher._compat import HAS_PYARROW
 from datamorpher.cleaner import clean_data
 from datamorpher.converter import convert
 from datamorpher.reporter import build_report
 
+_UPLOAD_SUFFIXES = {".csv", ".xlsx", ".xls", ".json"}
+# Parquet is offered ahead of Excel, which is by far the slowest format to
+# write, whenever pyarrow can produce it
+_OUTPUT_FORMATS = ["csv", "parquet", "xlsx", "json"] if HAS_PYARROW else ["csv", "xlsx", "json"]
+# JSON uploads above this size are converted to CSV in chunks when possible
+_STREAM_MIN_BYTES = 64 * 1024 * 1024
+# Cached frames and outputs are kept for a few recent uploads, for at most
+# an hour, so memory does not grow with every file converted
+_CACHE_ENTRIES = 4
+_CACHE_TTL_SECONDS = 3600
+
+
+# Uploads are cached on their bytes, so converting the same file again (e.g.
+# after toggling an option) skips parsing, and cleaning when it is unchanged
+@st.cache_data(show_spinner=False, max_entries=_CACHE_ENTRIES, ttl=_CACHE_TTL_SECONDS)
+def _read_upload(data: bytes, suffix: str) -> pd.DataFrame:
+    """Parse uploaded file bytes according to the file suffix."""
+    return convert.read_from_buffer(io.BytesIO(data), suffix[1:])
+
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_ENTRIES, ttl=_CACHE_TTL_SECONDS)
+def _prepare_upload(data: bytes, suffix: str, clean: bool) -> tuple[pd.DataFrame, dict, int]:
+    """Return the uploaded frame, cleaned if requested, the cleaning info and input rows."""
+    df = _read_upload(data, suffix)
+    rows_in = len(df)
+    if clean:
+        df, info = clean_data(df)
+        return df, info, rows_in
+    return df, {"duplicates": 0, "imputed": {}}, rows_in
+
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_ENTRIES, ttl=_CACHE_TTL_SECONDS)
+def _detect_upload_types(data: bytes, suffix: str, clean: bool) -> dict:
+    """Return the detected column types of the prepared upload."""
+    return convert.detect_types(_prepare_upload(data, suffix, clean)[0])
+
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_ENTRIES, ttl=_CACHE_TTL_SECONDS)
+def _process(
+    data: bytes, suffix: str, fmt: str, clean: bool, want_report: bool
+) -> tuple[bytes, dict, int, int, float]:
+    """Convert the upload and return the output bytes, info, row counts, duration."""
+    start = time.perf_counter()
+    # The output is built in memory and handed to the download button as is
+    buf = io.BytesIO()
+    if (
+        suffix == ".json" and fmt == "csv" and not (clean or want_report)
+        and len(data) > _STREAM_MIN_BYTES
+    ):
+        # Large plain JSON lines to CSV conversions never hold the whole
+        # frame; reports need its column types, so they take the path below
+        try:
+            rows = convert.json_lines_to_csv(io.BytesIO(data), buf)
+            return buf.getvalue(), {"duplicates": 0, "imputed": {}}, rows, rows, time.perf_counter() - start
+        except ValueError:
+            # JSON arrays are converted whole
+            buf = io.BytesIO()
+    df, info, rows_in = _prepare_upload(data, suffix, clean)
+    convert.write_to_buffer(df, fmt, buf)
+    return buf.getvalue(), info, rows_in, len(df), time.perf_counter() - start
+
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_ENTRIES, ttl=_CACHE_TTL_SECONDS)
+def _make_report(data: bytes, name: str, fmt: str, clean: bool) -> str:
+    """Return the Markdown report of converting the upload."""
+    suffix = Path(name).suffix.lower()
+    _, info, rows_in, rows_out, duration = _process(data, suffix, fmt, clean, True)
+    return build_report(
+        Path(name),
+        Path(f"output.{fmt}"),
+        rows_in,
+        rows_out,
+        info,
+        _detect_upload_types(data, suffix, clean),
+        duration,
+    )
+
+
 st.set_page_config(page_title="DataMorpher")
 st.title("DataMorpher")
 
@@ -33,63 +112,32 @@ uploaded = st.file_uploader(
     type=["csv", "xlsx", "xls", "json"],
     accept_multiple_files=False,
 )
-fmt = st.radio("Output format", ["csv", "xlsx", "json"])
+fmt = st.radio("Output format", _OUTPUT_FORMATS)
 clean = st.checkbox("Clean data")
 want_report = st.checkbox("Generate report")
 process = st.button("Convert")
 
+# Conversions and reports are cached on their inputs, so reruns caused by
+# other widgets reuse them instead of converting again
 if process and uploaded:
-    start = time.perf_counter()
     suffix = Path(uploaded.name).suffix.lower()
-    if suffix == ".csv":
-        df = pd.read_csv(uploaded)
-    elif suffix in {".xlsx", ".xls"}:
-        df = pd.read_excel(uploaded)
-    elif suffix == ".json":
-        try:
-            df = pd.read_json(uploaded, lines=True)
-        except ValueError:
-            uploaded.seek(0)
-            df = pd.read_json(uploaded)
-    else:
+    if suffix not in _UPLOAD_SUFFIXES:
         st.error("Unsupported format")
         st.stop()
 
-    rows_in = len(df)
-    if clean:
-        df, info = clean_data(df)
-    else:
-        info = {"duplicates": 0, "imputed": {}}
-
-    buf = io.BytesIO()
-    out_path = Path(f"output.{fmt}")
-    convert.write(df, out_path)
-    with open(out_path, "rb") as f:
-        buf.write(f.read())
-    buf.seek(0)
-    duration = time.perf_counter() - start
-    rows_out = len(df)
-
+    data = uploaded.getvalue()
+    output = _process(data, suffix, fmt, clean, want_report)[0]
     st.download_button(
         "Download file",
-        buf,
-        file_name=out_path.name,
+        output,
+        file_name=f"output.{fmt}",
         mime="application/octet-stream",
     )
 
     if want_report:
-        report_text = build_report(
-            Path(uploaded.name),
-            out_path,
-            rows_in,
-            rows_out,
-            info,
-            convert.detect_types(df),
-            duration,
-        )
         st.download_button(
             "Download report",
-            report_text,
+            _make_report(data, uploaded.name, fmt, clean),
             file_name="report.md",
             mime="text/markdown",
         )
@@ -1,12 +1,21 @@
+import json
+
+import numpy as np
 import pandas as pd
 
+from datamorpher._utils import nonnull_sample
 from datamorpher.cleaner import (
-    _extract_textual_date,
+    TransformationLog,
+    _extract_textual_dates,
     _is_product_name,
     _normalize_booleans_extended,
     _normalize_units,
+    _sample_accepts,
     _validate_column_semantics,
+    _validate_dates_extended,
+    _validate_numeric_extended,
     _words_to_num_extended,
+    _words_to_num_series,
     clean_data,
 )
 
@@ -20,6 +29,89 @@ def test_cleaning_removes_duplicates_and_imputes() -> None:
     assert not cleaned.isna().any().any()
 
 
+def test_cleaning_leaves_input_untouched() -> None:
+    """Test that the caller's frame is not modified, with or without duplicates."""
+    for df in (
+        pd.DataFrame({"price": ["$5", "10k", None], "score": [1.5, None, 2.5]}),
+        pd.DataFrame({"price": ["$5", "$5", None], "score": [1.5, 1.5, None]}),
+    ):
+        original = df.copy()
+        cleaned, _ = clean_data(df)
+        pd.testing.assert_frame_equal(df, original)
+        assert cleaned is not df
+        assert not cleaned.isna().any().any()
+
+
+def test_chunked_cleaning_matches_whole_frame() -> None:
+    """Test that chunked cleaning gives the whole-frame result."""
+    df = pd.DataFrame({
+        "amount": ["10k", "$5", "7", None, "12", "3", "abc", "8", "9"],
+        "date": [
+            "2021-01-05", "05/01/2021", None, "2021-02-03", "bad",
+            "2020/07/08", "2021-03-01", "2021-04-01", "2021-05-01",
+        ],
+        "flag": ["yes", "no", None, "TRUE", "0", "yes", "no", "yes", "no"],
+    })
+    whole, whole_info = clean_data(df)
+    chunked, chunked_info = clean_data(df, chunk_rows=4)
+    pd.testing.assert_frame_equal(whole, chunked)
+    assert chunked_info["imputed"] == whole_info["imputed"]
+    assert chunked_info["invalid"] == whole_info["invalid"]
+
+    # Every chunk follows the decision taken for the whole column, whatever
+    # its own values would give on their own
+    mostly_text = pd.DataFrame({"amount": ["12", "15", "x", "y", "z", "40"]})
+    cleaned, _ = clean_data(mostly_text, chunk_rows=2)
+    assert cleaned["amount"].tolist()[:2] == [12.0, 15.0]
+    assert cleaned["amount"].dtype == float
+    first_chunk_numbers = pd.DataFrame({"price": ["12", "15", "x", "y", "z", "w"]})
+    cleaned, _ = clean_data(first_chunk_numbers, chunk_rows=2)
+    assert cleaned["price"].tolist() == first_chunk_numbers["price"].tolist()
+
+
+def test_chunked_cleaning_on_messy_columns() -> None:
+    """Test that random mixes of messy values clean alike in any chunk size."""
+    values = [
+        None, "12", "3.5", "$5", "10k", "1,200", "twenty five", "yes", "no", "true",
+        "2021-01-05", "05/01/2021", "Jan 5 2022", "invalid_date", "abc", "Paris", "x7y", "inf",
+    ]
+    rng = np.random.default_rng(0)
+    names = ["price", "amount", "created", "is_on", "city", "notes", "stock"]
+    for _ in range(25):
+        rows = int(rng.integers(2, 30))
+        columns = rng.choice(names, size=int(rng.integers(1, 4)), replace=False)
+        df = pd.DataFrame({col: rng.choice(np.array(values, dtype=object), size=rows) for col in columns})
+        whole, whole_info = clean_data(df)
+        chunked, chunked_info = clean_data(df, chunk_rows=int(rng.integers(1, rows + 1)))
+        pd.testing.assert_frame_equal(whole.astype(object), chunked.astype(object))
+        assert chunked_info["invalid"] == whole_info["invalid"]
+        assert chunked_info["imputed"] == whole_info["imputed"]
+
+
+def test_repetitive_text_is_categorical() -> None:
+    """Test that low-cardinality text columns are stored as categories."""
+    df = pd.DataFrame({
+        "city": ["Paris", "Rome", "Paris", None, "Rome", "Paris"],
+        "note": ["a", "b", "c", "d", "e", "f"],
+    })
+    cleaned, info = clean_data(df)
+    assert isinstance(cleaned["city"].dtype, pd.CategoricalDtype)
+    assert cleaned["city"].tolist() == ["Paris", "Rome", "Paris", "Paris", "Rome", "Paris"]
+    assert info["imputed"]["city"] == "mode"
+    assert not isinstance(cleaned["note"].dtype, pd.CategoricalDtype)
+
+
+def test_preserved_columns_keep_their_dtype() -> None:
+    """Test that columns reported as preserved come back as they were."""
+    for ids in (["A1", "B2", "C3", "D4", "E5", "F6"], ["A1", "A1", "A1", "A1", "B2", "B2"]):
+        df = pd.DataFrame({"product_id": ids, "note": list("abcdef")})
+        cleaned, info = clean_data(df)
+        assert "Column 'product_id' detected as identifier - preserved as is" in info["warnings"]
+        # Repetitive identifiers are not turned into categories either
+        assert cleaned["product_id"].dtype == object
+        assert cleaned["product_id"].tolist() == ids
+
+
 def test_numeric_and_date_validation() -> None:
     df = pd.DataFrame(
         {
@@ -47,6 +139,17 @@ def test_numeric_and_date_validation() -> None:
         assert date_warning, "Missing warning about invalid date"
 
 
+def test_converted_numbers_keep_64_bit_dtypes() -> None:
+    """Test that cleaned numbers are not narrowed into overflowing dtypes."""
+    converted, _ = _validate_numeric_extended(pd.Series(["1", "2", "300"]))
+    assert converted.dtype == np.int64
+    words, _ = _validate_numeric_extended(pd.Series(["1", "twenty-eight", "300"]))
+    assert words.dtype == np.float64
+    assert words.tolist() == [1, 28, 300]
+    cleaned, _ = clean_data(pd.DataFrame({"stock": ["120", "7", "30"]}))
+    assert (cleaned["stock"] * 1000).tolist() == [120000, 7000, 30000]
+
+
 def test_date_format_variants() -> None:
     df = pd.DataFrame(
         {
@@ -58,6 +161,22 @@ def test_date_format_variants() -> None:
     assert list(cleaned["date"]) == expected
 
 
+def test_typed_columns_skip_date_parsing() -> None:
+    """Test that timestamp columns are only formatted and numbers never parse."""
+    stamps = pd.Series(pd.to_datetime(["2021-03-04 10:30", None]))
+    formatted, invalid = _validate_dates_extended(stamps)
+    assert formatted.tolist()[0] == "2021-03-04"
+    assert invalid == 0
+    assert _validate_dates_extended(pd.Series([20210304, 5])) == (None, 0)
+    # Dropping a midnight time is still a logged change
+    transformations = {}
+    midnights = pd.Series(pd.to_datetime(["2021-01-01", "2021-02-03"]))
+    _validate_dates_extended(midnights, column="d", transformations=transformations)
+    assert list(transformations["d"]) == [
+        "2021-01-01 00:00:00 -> 2021-01-01", "2021-02-03 00:00:00 -> 2021-02-03"
+    ]
+
+
 def test_complex_number_words() -> None:
     """Test enhanced number word recognition."""
     # Simple numbers
@@ -76,6 +195,80 @@ def test_complex_number_words() -> None:
     assert _words_to_num_extended("fifty dollars") == 50.0
 
 
+def test_vectorized_number_words_match_scalar() -> None:
+    """Test that the vectorized word parser agrees with the scalar one."""
+    series = pd.Series(
+        ["twenty five", "Twenty-Eight", "thirty nine ninety five", "one thousand two hundred", "abc", None],
+        index=[0, 0, 1, 2, 3, 4],
+    )
+    result = _words_to_num_series(series)
+    expected = series.apply(_words_to_num_extended).astype(float)
+    assert list(result.index) == list(series.index)
+    assert result.equals(expected)
+
+
+def test_scientific_notation_is_logged() -> None:
+    """Test that numbers written in scientific notation are logged when parsed."""
+    transformations = {}
+    converted, _ = _validate_numeric_extended(pd.Series(["1E3", "5", "2.5e-1"]), "stock", transformations)
+    assert converted.tolist() == [1000.0, 5.0, 0.25]
+    assert list(transformations["stock"]) == ["1E3 -> 1000.0", "2.5e-1 -> 0.25"]
+
+
+def test_number_words_with_duplicate_index() -> None:
+    """Test that number words are written back to their own rows."""
+    df = pd.DataFrame(
+        {"amount": ["twenty five", "3", "fifty", "7"], "price": ["5", "six", "12", "1,200"]},
+        index=[0, 0, 1, 1],
+    )
+    cleaned, info = clean_data(df)
+    assert cleaned["amount"].tolist() == [25, 3, 50, 7]
+    assert cleaned["price"].tolist() == [5, 6, 12, 1200]
+    assert "six -> 6.0" in info["transformations"]["price"]
+
+
+def test_sample_gate_for_large_columns() -> None:
+    """Test that long columns are only fully validated when a sample converts."""
+    numbers = pd.Series(["12", "7 units", "three"] * 500)
+    text = pd.Series(["apple", "pear", "plum"] * 500)
+    assert _sample_accepts(_validate_numeric_extended, numbers)
+    assert not _sample_accepts(_validate_numeric_extended, text)
+    # Short columns are left to the full validation
+    assert _sample_accepts(_validate_numeric_extended, text.head(10))
+
+
+def test_nonnull_sample_takes_leading_values() -> None:
+    """Test that detection samples are the first non-null values of a column."""
+    series = pd.Series([None] * 100 + ["a"] * 5 + [None] * 1000 + list("bcdefghijklmnopqrstuvwxyz"))
+    assert nonnull_sample(series, 20).equals(series.dropna().head(20))
+    assert nonnull_sample(pd.Series([None, None]), 20).empty
+    assert nonnull_sample(series, 0).empty
+
+
+def test_transformation_log_formats_pairs() -> None:
+    """Test that bulk transformation pairs read back as report messages."""
+    log = TransformationLog()
+    log.append("yesterday -> 2024-01-01")
+    log.add_pairs(np.array(["10k sales", "7 units"], dtype=object), np.array([10.0, 7.0]), " (numeric extraction)")
+    assert len(log) == 3
+    assert list(log) == [
+        "yesterday -> 2024-01-01",
+        "10k sales -> 10.0 (numeric extraction)",
+        "7 units -> 7.0 (numeric extraction)",
+    ]
+    assert log[1] == "10k sales -> 10.0 (numeric extraction)"
+
+
+def test_transformations_are_plain_lists() -> None:
+    """Test that clean_data reports transformations as serializable lists."""
+    df = pd.DataFrame({"amount": ["twenty five", "3", "$5 USD", "7"]}, index=[0, 0, 1, 1])
+    _, info = clean_data(df)
+    assert info["transformations"] == {
+        "amount": ["twenty five -> 25.0", "$5 USD -> 5 (numeric extraction)"]
+    }
+    assert json.loads(json.dumps(info))["transformations"] == info["transformations"]
+
+
 def test_unit_normalization() -> None:
     """Test unit and currency normalization."""
     data = pd.Series(["10k", "$50.99", "100,000", "5M", "200 units"])
@@ -130,17 +323,20 @@ def test_product_name_detection() -> None:
 
 def test_textual_date_extraction() -> None:
     """Test extraction of dates from textual formats."""
-    # Test ordinal formats
-    assert _extract_textual_date("20th Feb 2023") is not None
-    assert _extract_textual_date("1st January 2022") is not None
-    
-    # Test month-first formats
-    assert _extract_textual_date("February 20 2023") is not None
-    assert _extract_textual_date("Jan 5 2022") is not None
-    
-    # Invalid formats should return None
-    assert _extract_textual_date("Not a date") is None
-    assert _extract_textual_date("123456") is None
+    values = [
+        # Ordinal formats
+        "20th Feb 2023", "1st January 2022", "32nd March 2020", "1st Foo 2020",
+        # Month-first formats
+        "February 20 2023", "Jan 5 2022", "Sept 9 2021", "December 8 2022 noon",
+        # Invalid formats
+        "Not a date", "123456", "today",
+    ]
+    result = _extract_textual_dates(pd.Series(values, index=[0, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9]))
+    assert result.where(result.notna(), None).tolist() == [
+        "2023-02-20", "2022-01-01", None, None,
+        "2023-02-20", "2022-01-05", None, "2022-12-08",
+        None, None, None,
+    ]
 
 
 def test_advanced_boolean_normalization() -> None:
@@ -148,16 +344,18 @@ def test_advanced_boolean_normalization() -> None:
     # Various boolean representations
     bool_series = pd.Series(["true", "yes", "False", "no", "1", "0", "active", "inactive"])
     normalized = _normalize_booleans_extended(bool_series)
+    assert normalized.dtype == "boolean"
+    values = normalized.tolist()
     
     # Check correct normalization
-    assert normalized[0] is True   # "true"
-    assert normalized[1] is True   # "yes"
-    assert normalized[2] is False  # "False"
-    assert normalized[3] is False  # "no"
-    assert normalized[4] is True   # "1"
-    assert normalized[5] is False  # "0"
-    assert normalized[6] is True   # "active"
-    assert normalized[7] is False  # "inactive"
+    assert values[0] is True   # "true"
+    assert values[1] is True   # "yes"
+    assert values[2] is False  # "False"
+    assert values[3] is False  # "no"
+    assert values[4] is True   # "1"
+    assert values[5] is False  # "0"
+    assert values[6] is True   # "active"
+    assert values[7] is False  # "inactive"
 
 
 def test_contextual_detection() -> None:
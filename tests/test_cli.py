@@ -15,3 +15,31 @@ def test_cli_conversion(tmp_path: Path) -> None:
     result = runner.invoke(app, ["--input", str(src), "--output", str(out)])
     assert result.exit_code == 0
     assert out.exists()
+
+    chunked = tmp_path / "chunked.json"
+    result = runner.invoke(
+        app, ["--input", str(src), "--output", str(chunked), "--clean", "--chunk-rows", "1"]
+    )
+    assert result.exit_code == 0
+    assert pd.read_json(chunked, lines=True).equals(df)
+
+
+def test_cli_report_left_intact_on_failure(tmp_path: Path, monkeypatch) -> None:
+    runner = CliRunner()
+    src = tmp_path / "in.csv"
+    pd.DataFrame({"a": ["é", "b"]}).to_csv(src, index=False)
+    report = tmp_path / "report.md"
+    args = ["--input", str(src), "--output", str(tmp_path / "out.json"), "--report", str(report), "--force"]
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0
+    assert "Column Types" in report.read_text(encoding="utf-8")
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("report failed")
+
+    monkeypatch.setattr("datamorpher.reporter.build_report", fail)
+    previous = report.read_bytes()
+    result = runner.invoke(app, args)
+    assert result.exit_code != 0
+    assert report.read_bytes() == previous
+    assert list(tmp_path.glob("*.partial")) == []
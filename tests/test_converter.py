@@ -1,9 +1,12 @@
+import io
 from pathlib import Path
 
 import pandas as pd
 import pytest
 
+from datamorpher import converter
 from datamorpher.converter import (
+    _has_nested_values,
     _infer_column_type,
     _refine_inferred_types,
     convert,
@@ -25,6 +28,99 @@ def test_csv_to_excel(tmp_path: Path) -> None:
     assert df_x.equals(df)
 
 
+def test_write_to_buffer_matches_file_output(tmp_path: Path) -> None:
+    """Test that in-memory output holds the same bytes as a written file."""
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    for fmt in ("csv", "json"):
+        buf = io.BytesIO()
+        convert.write_to_buffer(df, fmt, buf)
+        path = tmp_path / f"out.{fmt}"
+        convert.write(df, path)
+        assert buf.getvalue() == path.read_bytes()
+    buf = io.BytesIO()
+    convert.write_to_buffer(df, "xlsx", buf)
+    buf.seek(0)
+    assert pd.read_excel(buf).equals(df)
+    with pytest.raises(ValueError):
+        convert.write_to_buffer(df, "txt", io.BytesIO())
+
+
+def test_json_lines_to_csv_in_chunks(tmp_path: Path) -> None:
+    """Test that chunked JSON lines conversion matches the whole-frame CSV."""
+    src = tmp_path / "lines.json"
+    src.write_text("".join(f'{{"a": {i}, "b": {{"c": "x{i}"}}}}\n' for i in range(5)))
+    buf = io.BytesIO()
+    with src.open("rb") as f:
+        assert convert.json_lines_to_csv(f, buf, chunk_rows=2) == 5
+    whole = tmp_path / "whole.csv"
+    convert.write(convert.read(src), whole)
+    assert buf.getvalue() == whole.read_bytes()
+
+    with pytest.raises(ValueError):
+        convert.json_lines_to_csv(io.BytesIO(b'[{"a": 1}]'), io.BytesIO())
+
+
+def test_json_lines_to_csv_consistent_across_chunks(tmp_path: Path) -> None:
+    """Test that gaps and late keys in one chunk format every chunk alike."""
+    src = tmp_path / "sparse.json"
+    src.write_text(
+        '{"a": 1, "n": {"c": 1}}\n{"a": 2, "n": {"c": 2}}\n'
+        '{"a": null, "n": {"c": 3, "d": "x"}}\n{"a": 4, "n": {"c": 4}, "late": 5}\n'
+    )
+    buf = io.BytesIO()
+    with src.open("rb") as f:
+        assert convert.json_lines_to_csv(f, buf, chunk_rows=2) == 4
+    whole = tmp_path / "whole.csv"
+    convert.write(convert.read(src), whole)
+    assert buf.getvalue() == whole.read_bytes()
+    assert buf.getvalue().decode().splitlines()[1] == "1.0,,1,"
+
+    # Booleans next to gaps and numbers next to text read alike in any chunk
+    src.write_text('{"f": true, "m": 1}\n{"f": null, "m": null}\n{"f": false, "m": "x"}\n')
+    outputs = set()
+    for chunk_rows in (1, 2, 3):
+        buf = io.BytesIO()
+        with src.open("rb") as f:
+            convert.json_lines_to_csv(f, buf, chunk_rows=chunk_rows)
+        outputs.add(buf.getvalue())
+    assert outputs == {b"f,m\nTrue,1\n,\nFalse,x\n"}
+
+    # Blank lines never count as a chunk without the column
+    outputs = set()
+    for chunk_rows in (1, 2, 3):
+        buf = io.BytesIO()
+        convert.json_lines_to_csv(io.BytesIO(b'\n{"a": 1}\n{"a": 2}\n\n'), buf, chunk_rows=chunk_rows)
+        outputs.add(buf.getvalue())
+    assert outputs == {b"a\n1\n2\n"}
+
+
+def test_parquet_round_trip(tmp_path: Path) -> None:
+    """Test Parquet output, with mixed columns stored as text."""
+    df = pd.DataFrame({"a": [1.0, None], "mixed": [5, "five"], "b": ["x", "y"]})
+    out = tmp_path / "out.parquet"
+    if not converter.HAS_PYARROW:
+        with pytest.raises(ValueError, match="pyarrow"):
+            convert.write(df, out)
+        return
+    convert.write(df, out)
+    df_back = convert.read(out)
+    assert df_back["mixed"].tolist() == ["5", "five"]
+    assert df_back.drop(columns="mixed").equals(df.drop(columns="mixed"))
+
+    # Dicts and lists keep Arrow's struct and list types; values of no one
+    # type are stored as JSON text
+    nested = pd.DataFrame({
+        "n": [{"c": 1, "d": "x"}, {"c": 2, "d": None}],
+        "l": [[1, 2], [3]],
+        "odd": [[1, 2], "s"],
+    })
+    convert.write(nested, out)
+    back = convert.read(out)
+    assert back["n"].tolist() == nested["n"].tolist()
+    assert back["l"].tolist() == nested["l"].tolist()
+    assert back["odd"].tolist() == ["[1, 2]", "s"]
+
+
 def test_json_reading_variants(tmp_path: Path) -> None:
     ndjson = tmp_path / "data_lines.json"
     with ndjson.open("w", encoding="utf-8") as f:
@@ -39,6 +135,45 @@ def test_json_reading_variants(tmp_path: Path) -> None:
     assert len(df_lines) == 2
     assert len(df_array) == 2
 
+    # Uploaded bytes go through the same detection
+    with ndjson.open("rb") as f:
+        assert convert.read_from_buffer(f, "json").equals(df_lines)
+    with array_json.open("rb") as f:
+        assert convert.read_from_buffer(f, "json").equals(df_array)
+
+
+def test_json_lines_with_changing_field_types(tmp_path: Path) -> None:
+    src = tmp_path / "mixed.json"
+    src.write_text('{"a": 1}\n{"a": "x"}\n', encoding="utf-8")
+    assert convert.read(src)["a"].tolist() == [1, "x"]
+
+
+def test_json_lines_same_with_and_without_pyarrow(tmp_path: Path, monkeypatch) -> None:
+    """Test that the Arrow and pandas JSON readers give the same frame."""
+    src = tmp_path / "typed.json"
+    src.write_text(
+        '{"id": "001", "date": "2021-01-01", "ok": true, "n": 1, "p": {"color": "red"}, "none": null}\n'
+        '{"id": "002", "date": "2021-02-01", "ok": null, "n": null, "p": {"size": 3}, "none": null}\n',
+        encoding="utf-8",
+    )
+    df = convert.read(src)
+    monkeypatch.setattr(converter, "HAS_PYARROW", False)
+    pd.testing.assert_frame_equal(df, convert.read(src))
+    assert df["id"].tolist() == ["001", "002"]
+    assert df["date"].tolist() == ["2021-01-01", "2021-02-01"]
+    assert df.loc[0, "ok"] is True
+    assert df["p"].tolist() == [{"color": "red"}, {"size": 3}]
+
+
+def test_json_date_strings_survive_conversion(tmp_path: Path) -> None:
+    src = tmp_path / "dates.json"
+    src.write_text('{"a": 1, "d": "2023-01-15"}\n{"a": 2, "d": "2023-02-01"}\n', encoding="utf-8")
+    df = convert.read(src)
+    assert list(df.columns) == ["a", "d"]
+    out = tmp_path / "out.json"
+    convert.write(df, out)
+    assert out.read_text(encoding="utf-8") == '{"a":1,"d":"2023-01-15"}\n{"a":2,"d":"2023-02-01"}\n'
+
 
 def test_json_to_csv_flatten(tmp_path: Path) -> None:
     src = tmp_path / "nested.json"
@@ -51,6 +186,23 @@ def test_json_to_csv_flatten(tmp_path: Path) -> None:
     assert df_out.loc[0, "b.c"] == 2
 
 
+def test_json_lines_keep_python_containers(tmp_path: Path) -> None:
+    """Test that nested JSON values are read back as dicts and lists."""
+    src = tmp_path / "nested_lists.json"
+    src.write_text('{"a": [1, 2], "b": {"c": [3]}}\n{"a": [4], "b": {"c": []}}')
+    df = convert.read(src)
+    assert df.loc[0, "a"] == [1, 2]
+    assert df.loc[1, "b"] == {"c": []}
+
+
+def test_nested_value_detection() -> None:
+    """Test that nested values are found anywhere in a column."""
+    assert _has_nested_values(pd.Series(["a", "b", {"c": 1}]))
+    assert _has_nested_values(pd.Series([1, None, [2, 3]]))
+    assert not _has_nested_values(pd.Series(["a", None, "b"]))
+    assert not _has_nested_values(pd.Series([1.5, 2.0]))
+
+
 def test_column_type_detection() -> None:
     """Test the detection of column types."""
     # Create a test dataframe with various column types
@@ -102,6 +254,17 @@ def test_type_detection_edge_cases() -> None:
     assert refined["mixed_bool"] in ["string", "boolean"]  # Either is acceptable
 
 
+def test_detect_types_on_sparse_float_columns() -> None:
+    """Test that samples skip leading gaps and later fractions still count."""
+    df = pd.DataFrame({
+        "sparse": [None] * 100 + [3.0, 4.0, 5.0],
+        "late_fraction": [float(i) for i in range(102)] + [0.5],
+        "late_inf": [float(i) for i in range(102)] + [float("inf")],
+    })
+    types = convert.detect_types(df)
+    assert types == {"sparse": "integer", "late_fraction": "floating", "late_inf": "floating"}
+
+
 def test_detect_types_on_real_data() -> None:
     """Test type detection on more realistic data."""
     df = pd.DataFrame({
@@ -1,18 +1,24 @@
+import io
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
+from datamorpher.cleaner import TransformationLog, clean_data
 from datamorpher.reporter import (
     _categorize_transformation,
     _group_similar_transformations,
+    _markdown_table,
     build_report,
     format_example_values,
 )
 
 
-def test_report_contains_summary(tmp_path: Path) -> None:
+def test_report_contains_summary(report_dir: Path) -> None:
     types = {"a": "integer"}
     report = build_report(
         Path("in.csv"),
-        tmp_path / "out.csv",
+        report_dir / "out.csv",
         1,
         1,
         {"duplicates": 0, "imputed": {}},
@@ -22,9 +28,10 @@ def test_report_contains_summary(tmp_path: Path) -> None:
     assert "DataMorpher Report" in report
     assert "in.csv" in report
     assert "out.csv" in report
+    assert "| a        | integer         |" in report
 
 
-def test_report_includes_transformations(tmp_path: Path) -> None:
+def test_report_includes_transformations(report_dir: Path) -> None:
     types = {"a": "integer"}
     clean_info = {
         "duplicates": 0,
@@ -34,7 +41,7 @@ def test_report_includes_transformations(tmp_path: Path) -> None:
     }
     report = build_report(
         Path("in.csv"),
-        tmp_path / "out.csv",
+        report_dir / "out.csv",
         1,
         1,
         clean_info,
@@ -45,6 +52,21 @@ def test_report_includes_transformations(tmp_path: Path) -> None:
     assert "1 -> 2" in report
 
 
+def test_report_streams_to_file_object() -> None:
+    """Test that writing the report to ``out`` gives the returned text."""
+    clean_info = {
+        "duplicates": 1,
+        "imputed": {},
+        "transformations": {"a": ["NaN -> 2.00 (median)"]},
+        "warnings": ["Column 'a' contains 1 negative value(s)"],
+    }
+    for info in (clean_info, {"duplicates": 0, "imputed": {}}):
+        args = (Path("in.csv"), Path("out.csv"), 2, 1, info, {"a": "integer"}, 0.1)
+        out = io.StringIO()
+        assert build_report(*args, out=out) is None
+        assert out.getvalue() == build_report(*args)
+
+
 def test_report_handles_warnings() -> None:
     """Test that warnings are properly included in the report."""
     types = {"a": "integer", "b": "string"}
@@ -68,6 +90,17 @@ def test_report_handles_warnings() -> None:
     assert "preserved as is" in report
 
 
+def test_markdown_table_layout() -> None:
+    """Test that the column table pads cells like a GitHub markdown table."""
+    table = _markdown_table(["Column", "Type"], [["price_usd", "currency"], ["id", "identifier"]])
+    assert table.splitlines() == [
+        "| Column    | Type       |",
+        "|-----------|------------|",
+        "| price_usd | currency   |",
+        "| id        | identifier |",
+    ]
+
+
 def test_transformation_grouping() -> None:
     """Test grouping of similar transformations."""
     # Create a list of transformations of different types
@@ -100,6 +133,25 @@ def test_transformation_grouping() -> None:
     assert len(grouped["Date Format Standardization"]) == 2
 
 
+def test_grouping_uses_logged_categories() -> None:
+    """Test that categories tagged by the cleaner win over text heuristics."""
+    log = TransformationLog()
+    # "separator" contains "sep", which the text heuristics take for a month
+    log.add_pairs(np.array(["1,200"]), np.array([1200.0]), " (separator cleaning)", "Other Transformations")
+    log.append("NaN -> 3.00 (median)")
+    grouped = _group_similar_transformations(log)
+    assert grouped == {
+        "Other Transformations": ["1,200 -> 1200.0 (separator cleaning)"],
+        "Median Imputation": ["NaN -> 3.00 (median)"],
+    }
+
+    # The lists clean_data returns keep the tags, so reports built from its
+    # info group separator cleaning the same way
+    _, info = clean_data(pd.DataFrame({"price": ["199,99", "$5", "12"]}))
+    report = build_report(Path("in.csv"), Path("out.csv"), 3, 3, info, {"price": "currency"}, 0.0)
+    assert "**Other Transformations:**\n- 199,99 -> 19999.0 (separator cleaning)" in report
+
+
 def test_transformation_categorization() -> None:
     """Test categorization of individual transformations."""
     # Test different types of transformations
@@ -108,6 +160,10 @@ def test_transformation_categorization() -> None:
     assert _categorize_transformation("10k -> 10000 (unit conversion k)") == "Unit/Currency Conversion"
     assert _categorize_transformation("$50.99 -> 50.99 (currency conversion)") == "Unit/Currency Conversion"
     assert _categorize_transformation("01/15/2023 -> 2023-01-15") == "Date Format Standardization"
+    assert _categorize_transformation("2023-01-15 12:00 -> 2023-01-15") == "Date Format Standardization"
+    # Dates are found anywhere in a change, not only at the start of a side
+    assert _categorize_transformation("on 15/01/2023 -> 2023-01-15") == "Date Format Standardization"
+    assert _categorize_transformation("1/15/2023x -> 42") == "Other Transformations"
     assert _categorize_transformation("twenty five -> 25.0") == "Text to Number Conversion"
     assert _categorize_transformation("100 units -> 100 (extraction)") == "Numeric Value Extraction"
     assert _categorize_transformation("something else") == "Other Transformations"
@@ -129,6 +185,11 @@ def test_example_values_formatting() -> None:
     many_values = format_example_values([1, 2, 3, 4, 5, 6])
     assert many_values == "1, 2, 3"
 
+    # Iterators are only consumed up to the examples shown
+    values = iter(range(10))
+    assert format_example_values(values) == "0, 1, 2"
+    assert next(values) == 3
+
 
 def test_comprehensive_report() -> None:
     """Test a comprehensive report with all features."""